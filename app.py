@@ -3,12 +3,17 @@ Hugging Face Spaces entry point.
 This file is required for Hugging Face Spaces deployment.
 """
 
+import os
 import sys
 
 import uvicorn
 from dotenv import load_dotenv
 
-load_dotenv()
+# Skip re-parsing the .env file in processes that inherit an already loaded
+# environment (e.g. uvicorn reload workers).
+if not os.environ.get("DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["DOTENV_LOADED"] = "1"
 
 
 # Hugging Face Spaces will automatically run this app
@@ -28,4 +33,13 @@ if __name__ == "__main__":
         from src.core.settings import settings
         from src.main import app
 
-        uvicorn.run(app, host="0.0.0.0", port=settings.PORT)
+        # "auto" picks uvloop and httptools (installed via uvicorn[standard]) when
+        # available, falling back to asyncio/h11 on platforms without them.
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=settings.PORT,
+            loop="auto",
+            http="auto",
+            access_log=settings.ACCESS_LOG,
+        )
@@ -1,6 +1,6 @@
-import json
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
+import orjson
 from pydantic import BaseModel
 
 from ..models.claude import (
@@ -19,6 +19,8 @@ from ..models.claude import (
 )
 from ..models.gemini import (
     GeminiContent,
+    GeminiFunctionCall,
+    GeminiFunctionResponse,
     GeminiPart,
     GeminiRequest,
     GeminiResponse,
@@ -32,6 +34,21 @@ from ..utils.utils import (
 
 logger = get_logger(__name__)
 
+_FINISH_REASON_MAP = {
+    "STOP": "end_turn",
+    "MAX_TOKENS": "max_tokens",
+    "TOOL_USE": "tool_use",
+}
+
+# (Gemini generationConfig key, ClaudeMessagesRequest attribute)
+_GEN_CFG_KEYS = (
+    ("maxOutputTokens", "max_tokens"),
+    ("temperature", "temperature"),
+    ("topP", "top_p"),
+    ("topK", "top_k"),
+    ("stopSequences", "stop_sequences"),
+)
+
 
 def _map_gemini_to_claude_finish_reason(gemini_reason: Optional[str]) -> str:
     """Maps Gemini's finish reason to Claude's, with logging for unexpected cases."""
@@ -41,54 +58,69 @@ def _map_gemini_to_claude_finish_reason(gemini_reason: Optional[str]) -> str:
         )
         return "end_turn"
 
-    reason_map = {
-        "STOP": "end_turn",
-        "MAX_TOKENS": "max_tokens",
-        "TOOL_USE": "tool_use",
-    }
-
-    if gemini_reason in reason_map:
-        return reason_map[gemini_reason]
+    mapped = _FINISH_REASON_MAP.get(gemini_reason)
+    if mapped is not None:
+        return mapped
 
     # Handle other reasons like SAFETY, RECITATION, etc.
     logger.warning(
-        f"Received unhandled Gemini finishReason '{gemini_reason}', defaulting to 'stop'."
+        "Received unhandled Gemini finishReason '%s', defaulting to 'stop'.",
+        gemini_reason,
     )
     return "stop"  # A generic fallback for other cases
 
 
+# The request has already been validated at the API boundary, so the parts
+# are built with model_construct to skip re-running validation.
+def _text_part(part_data: Dict[str, Any]) -> GeminiPart:
+    return GeminiPart.model_construct(text=part_data.get("text", ""))
+
+
+def _tool_use_part(part_data: Dict[str, Any]) -> GeminiPart:
+    return GeminiPart.model_construct(
+        functionCall=GeminiFunctionCall.model_construct(
+            name=part_data.get("name"),
+            args=part_data.get("input", {}),
+        )
+    )
+
+
+def _tool_result_part(part_data: Dict[str, Any]) -> GeminiPart:
+    return GeminiPart.model_construct(
+        functionResponse=GeminiFunctionResponse.model_construct(
+            name=part_data.get("tool_use_id"),
+            response={"content": part_data.get("content")},
+        )
+    )
+
+
+_PART_DISPATCH = {
+    "text": _text_part,
+    "tool_use": _tool_use_part,
+    "tool_result": _tool_result_part,
+}
+
+
 def _transform_claude_content(
     content: Union[str, List[Dict[str, Any]]],
-) -> List[GeminiPart]:
-    """Transforms a Claude content block into a list of Gemini parts."""
-    parts = []
+) -> Tuple[List[GeminiPart], bool]:
+    """
+    Transforms a Claude content block into a list of Gemini parts.
+    Also reports whether any tool_result part was seen, in the same pass.
+    """
     if isinstance(content, str):
-        parts.append(GeminiPart(text=content))
-        return parts
+        return [GeminiPart.model_construct(text=content)], False
 
+    parts = []
+    saw_tool_result = False
     for part_data in content:
         part_type = part_data.get("type")
-        if part_type == "text":
-            parts.append(GeminiPart(text=part_data.get("text", "")))
-        elif part_type == "tool_use":
-            parts.append(
-                GeminiPart(
-                    functionCall={
-                        "name": part_data.get("name"),
-                        "args": part_data.get("input", {}),
-                    }
-                )
-            )
-        elif part_type == "tool_result":
-            parts.append(
-                GeminiPart(
-                    functionResponse={
-                        "name": part_data.get("tool_use_id"),
-                        "response": {"content": part_data.get("content")},
-                    }
-                )
-            )
-    return parts
+        if part_type == "tool_result":
+            saw_tool_result = True
+        handler = _PART_DISPATCH.get(part_type)
+        if handler:
+            parts.append(handler(part_data))
+    return parts, saw_tool_result
 
 
 def claude_request_to_gemini(
@@ -101,71 +133,96 @@ def claude_request_to_gemini(
 
     contents = []
     for message in claude_request.messages:
-        is_tool_response = isinstance(message.content, list) and any(
-            p.get("type") == "tool_result" for p in message.content
-        )
+        parts, is_tool_response = _transform_claude_content(message.content)
         role = (
             "tool"
             if is_tool_response
             else ("model" if message.role == "assistant" else "user")
         )
-        parts = _transform_claude_content(message.content)
         if parts:
-            contents.append(GeminiContent(role=role, parts=parts))
+            contents.append(GeminiContent.model_construct(role=role, parts=parts))
 
     system_instruction = None
     if claude_request.system:
         system_text = (
             claude_request.system
             if isinstance(claude_request.system, str)
-            else json.dumps(claude_request.system)
+            else orjson.dumps(claude_request.system).decode()
         )
-        system_instruction = GeminiSystemInstruction(
-            parts=[GeminiPart(text=system_text)]
+        system_instruction = GeminiSystemInstruction.model_construct(
+            parts=[GeminiPart.model_construct(text=system_text)]
         )
 
     generation_config = {
-        "maxOutputTokens": claude_request.max_tokens,
-        "temperature": claude_request.temperature,
-        "topP": claude_request.top_p,
-        "topK": claude_request.top_k,
-        "stopSequences": claude_request.stop_sequences,
+        key: value
+        for key, attr in _GEN_CFG_KEYS
+        if (value := getattr(claude_request, attr)) is not None
     }
-    generation_config = {k: v for k, v in generation_config.items() if v is not None}
 
-    if (
-        claude_request.response_format
-        and claude_request.response_format.get("type") == "json_object"
-    ):
+    response_format = claude_request.response_format
+    if response_format and response_format.get("type") == "json_object":
         generation_config["responseMimeType"] = "application/json"
 
     tools = None
     if claude_request.tools:
-        gemini_tools = [
-            {
-                "name": tool.get("name"),
-                "description": tool.get("description"),
-                "parameters": tool.get("input_schema"),
-            }
-            for tool in claude_request.tools
-        ]
-        tools = [{"functionDeclarations": gemini_tools}]
-
-    sanitized_tools = sanitize_gemini_tools(tools)
-
-    gemini_request = GeminiRequest(
+        # description and input_schema are optional on Claude tools, so plain
+        # .get() lookups are kept rather than an itemgetter.
+        tools = sanitize_gemini_tools(
+            [
+                {
+                    "functionDeclarations": [
+                        {
+                            "name": tool.get("name"),
+                            "description": tool.get("description"),
+                            "parameters": tool.get("input_schema"),
+                        }
+                        for tool in claude_request.tools
+                    ]
+                }
+            ]
+        )
+
+    gemini_request = GeminiRequest.model_construct(
         contents=contents,
         systemInstruction=system_instruction,
         generationConfig=generation_config,
-        tools=sanitized_tools,
+        tools=tools,
     )
 
     return model_name, gemini_request
 
 
+# The message_stop event never varies, so it is serialized once up front.
+_MESSAGE_STOP_SSE = (
+    b"event: message_stop\ndata: "
+    + ClaudeMessageStop.__pydantic_serializer__.to_json(ClaudeMessageStop())
+    + b"\n\n"
+)
+
+# Shared, never-mutated start block for text content; it carries no per-stream data.
+_TEXT_BLOCK_START = ClaudeContentBlock.model_construct(type="text", text="")
+
+
 class ClaudeStreamer:
     """Manages the state for transforming a Gemini stream to the Claude SSE format."""
 
+    __slots__ = (
+        "response_id",
+        "model",
+        "is_finished",
+        "content_block_index",
+        "last_block_type",
+        "message_started",
+        "meta_data_captured",
+    )
+
+    # Pre-encoded SSE prefixes, one per Claude event type.
+    _PREFIX_MESSAGE_START = b"event: message_start\ndata: "
+    _PREFIX_START = b"event: content_block_start\ndata: "
+    _PREFIX_DELTA = b"event: content_block_delta\ndata: "
+    _PREFIX_STOP = b"event: content_block_stop\ndata: "
+    _PREFIX_MESSAGE_DELTA = b"event: message_delta\ndata: "
+
     def __init__(self, response_id: str, model: str):
         self.response_id = response_id
         self.model = model
@@ -175,14 +232,14 @@ class ClaudeStreamer:
         self.message_started = False
         self.meta_data_captured = False
 
-    def _format_event(self, event_type: str, data: BaseModel) -> str:
-        json_data = data.model_dump_json()
-        return f"event: {event_type}\ndata: {json_data}\n\n"
+    @staticmethod
+    def _format_event(prefix: bytes, data: BaseModel) -> bytes:
+        return prefix + data.__pydantic_serializer__.to_json(data) + b"\n\n"
 
     def _ensure_message_started(
         self,
         chunk: Optional[GeminiResponse],
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """Yields the message_start event if it hasn't been sent yet."""
         if not self.message_started:
             self.message_started = True
@@ -191,21 +248,27 @@ class ClaudeStreamer:
                 if chunk and chunk.usageMetadata
                 else 0
             )
-            message_response = ClaudeMessageResponse(
+            message_response = ClaudeMessageResponse.model_construct(
                 id=self.response_id,
                 model=self.model,
                 content=[],
-                usage=ClaudeUsage(input_tokens=input_tokens, output_tokens=0),
+                usage=ClaudeUsage.model_construct(
+                    input_tokens=input_tokens, output_tokens=0
+                ),
             )
             yield self._format_event(
-                "message_start", ClaudeMessageStartEvent(message=message_response)
+                self._PREFIX_MESSAGE_START,
+                ClaudeMessageStartEvent.model_construct(message=message_response),
             )
 
     def format_chunk(
         self, chunk: Optional[GeminiResponse]
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         if self.is_finished:
             return
+        # Chunks without candidates (e.g. keep-alive pings) produce no events.
+        if chunk is not None and not chunk.candidates:
+            return
 
         has_content = chunk and chunk.candidates and chunk.candidates[0].content
         is_final_chunk = chunk is None or (
@@ -216,54 +279,66 @@ class ClaudeStreamer:
         if has_content:
             yield from self._ensure_message_started(chunk)
 
-            for part in chunk.candidates[0].content.parts:
-                current_block_type = None
-                delta_model: Optional[Union[ClaudeTextDelta, ClaudeInputJsonDelta]] = (
-                    None
-                )
-                start_block_model: Optional[ClaudeContentBlock] = None
-
-                if part.text:
-                    current_block_type = "text"
-                    delta_model = ClaudeTextDelta(text=part.text)
-                    start_block_model = ClaudeContentBlock(type="text", text="")
-                elif part.functionCall:
-                    current_block_type = "tool_use"
-                    fc = part.functionCall
-                    delta_model = ClaudeInputJsonDelta(
-                        partial_json=json.dumps(fc.args, ensure_ascii=False)
-                    )
-                    start_block_model = ClaudeContentBlock(
-                        type="tool_use", id=fc.name, name=fc.name, input={}
-                    )
+            # Hot loop: keep the streamer state in locals and write it back after.
+            fmt = self._format_event
+            last_block_type = self.last_block_type
+            index = self.content_block_index
+            parts = chunk.candidates[0].content.parts
+            try:
+                for part in parts:
+                    current_block_type = None
+                    delta_model: Optional[
+                        Union[ClaudeTextDelta, ClaudeInputJsonDelta]
+                    ] = None
+                    start_block_model: Optional[ClaudeContentBlock] = None
+
+                    if part.text:
+                        current_block_type = "text"
+                        delta_model = ClaudeTextDelta.model_construct(text=part.text)
+                        start_block_model = _TEXT_BLOCK_START
+                    elif part.functionCall:
+                        current_block_type = "tool_use"
+                        fc = part.functionCall
+                        delta_model = ClaudeInputJsonDelta.model_construct(
+                            partial_json=orjson.dumps(fc.args).decode()
+                        )
+                        start_block_model = ClaudeContentBlock.model_construct(
+                            type="tool_use", id=fc.name, name=fc.name, input={}
+                        )
 
-                if not current_block_type or not delta_model or not start_block_model:
-                    continue
+                    if (
+                        not current_block_type
+                        or not delta_model
+                        or not start_block_model
+                    ):
+                        continue
+
+                    if last_block_type and last_block_type != current_block_type:
+                        yield fmt(
+                            self._PREFIX_STOP,
+                            ClaudeContentBlockStop.model_construct(index=index),
+                        )
+                        index += 1
+                        last_block_type = None
+
+                    if not last_block_type:
+                        yield fmt(
+                            self._PREFIX_START,
+                            ClaudeContentBlockStart.model_construct(
+                                index=index, content_block=start_block_model
+                            ),
+                        )
+                        last_block_type = current_block_type
 
-                if self.last_block_type and self.last_block_type != current_block_type:
-                    yield self._format_event(
-                        "content_block_stop",
-                        ClaudeContentBlockStop(index=self.content_block_index),
-                    )
-                    self.content_block_index += 1
-                    self.last_block_type = None
-
-                if not self.last_block_type:
-                    yield self._format_event(
-                        "content_block_start",
-                        ClaudeContentBlockStart(
-                            index=self.content_block_index,
-                            content_block=start_block_model,
+                    yield fmt(
+                        self._PREFIX_DELTA,
+                        ClaudeContentBlockDelta.model_construct(
+                            index=index, delta=delta_model
                         ),
                     )
-                    self.last_block_type = current_block_type
-
-                yield self._format_event(
-                    "content_block_delta",
-                    ClaudeContentBlockDelta(
-                        index=self.content_block_index, delta=delta_model
-                    ),
-                )
+            finally:
+                self.last_block_type = last_block_type
+                self.content_block_index = index
 
         # --- Handle End of Stream ---
         if is_final_chunk:
@@ -286,18 +361,20 @@ class ClaudeStreamer:
                     stop_reason = "tool_use"
 
                 yield self._format_event(
-                    "content_block_stop",
-                    ClaudeContentBlockStop(index=self.content_block_index),
+                    self._PREFIX_STOP,
+                    ClaudeContentBlockStop.model_construct(
+                        index=self.content_block_index
+                    ),
                 )
 
             yield self._format_event(
-                "message_delta",
-                ClaudeMessageDelta(
+                self._PREFIX_MESSAGE_DELTA,
+                ClaudeMessageDelta.model_construct(
                     delta={"stop_reason": stop_reason, "stop_sequence": None},
                     usage={"output_tokens": output_tokens},
                 ),
             )
-            yield self._format_event("message_stop", ClaudeMessageStop())
+            yield _MESSAGE_STOP_SSE
             return
 
 
@@ -317,12 +394,12 @@ def gemini_response_to_claude(
             for part in candidate.content.parts:
                 if part.text:
                     content_blocks.append(
-                        ClaudeContentBlock(type="text", text=part.text)
+                        ClaudeContentBlock.model_construct(type="text", text=part.text)
                     )
                 elif part.functionCall:
                     fc = part.functionCall
                     content_blocks.append(
-                        ClaudeContentBlock(
+                        ClaudeContentBlock.model_construct(
                             type="tool_use", id=fc.name, name=fc.name, input=fc.args
                         )
                     )
@@ -343,10 +420,12 @@ def gemini_response_to_claude(
 
     model = gemini_response.modelVersion or original_request.model
 
-    return ClaudeMessageResponse(
+    return ClaudeMessageResponse.model_construct(
         id=response_id,
         model=model,
         content=content_blocks,
         stop_reason=stop_reason,
-        usage=ClaudeUsage(input_tokens=input_tokens, output_tokens=output_tokens),
+        usage=ClaudeUsage.model_construct(
+            input_tokens=input_tokens, output_tokens=output_tokens
+        ),
     )
@@ -1,6 +1,8 @@
-import json
+import time
+from dataclasses import dataclass
 from typing import Any, Generator, Optional, Union
 
+import orjson
 from pydantic import BaseModel
 
 from ..models.gemini import (
@@ -16,7 +18,8 @@ from .openai_transformers import (
 )
 
 
-class FormatterContext(BaseModel):
+@dataclass(slots=True)
+class FormatterContext:
     """A structured container for context needed by formatters."""
 
     response_id: str
@@ -35,7 +38,7 @@ class Formatter:
     def format_chunk(
         self,
         chunk: Optional[GeminiResponse],
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """Formats a single chunk for a streaming response."""
         raise NotImplementedError
 
@@ -47,10 +50,10 @@ class Formatter:
         """Formats a complete, non-streaming GeminiResponse."""
         return response
 
-    def format_error_chunk(self, message: str, status_code: int = 500) -> str:
-        """Formats a generic error message into an SSE event string."""
+    def format_error_chunk(self, message: str, status_code: int = 500) -> bytes:
+        """Formats a generic error message into an SSE event."""
         error_payload = {"error": {"message": message, "code": status_code}}
-        return f"data: {json.dumps(error_payload)}\n\n"
+        return b"data: " + orjson.dumps(error_payload) + b"\n\n"
 
 
 class GeminiFormatter(Formatter):
@@ -59,9 +62,13 @@ class GeminiFormatter(Formatter):
     def format_chunk(
         self,
         chunk: Optional[GeminiResponse],
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         if chunk:
-            yield f"data: {chunk.model_dump_json(exclude_unset=True)}\n\n"
+            yield (
+                b"data: "
+                + chunk.__pydantic_serializer__.to_json(chunk, exclude_unset=True)
+                + b"\n\n"
+            )
 
 
 class OpenAIFormatter(Formatter):
@@ -73,35 +80,46 @@ class OpenAIFormatter(Formatter):
         self.response_id = self.context.response_id
         self.model = self.context.model
         self.meta_data_captured = False
+        # OpenAI stamps every chunk of a stream with the same creation time.
+        self.created = int(time.time())
 
     def format_chunk(
         self,
         chunk: Optional[GeminiResponse],
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
+        if not chunk:
+            return
+
         # Try to capture metadata from the stream until we succeed
-        if chunk and not self.meta_data_captured:
-            if chunk.responseId:
-                self.response_id = f"chatcmpl-{chunk.responseId}"
+        if not self.meta_data_captured:
+            response_id = chunk.responseId
+            if response_id:
+                self.response_id = f"chatcmpl-{response_id}"
             if chunk.modelVersion:
                 self.model = chunk.modelVersion
             # Once we see a responseId, we assume all initial metadata is captured.
-            if chunk.responseId:
+            if response_id:
                 self.meta_data_captured = True
 
-        if chunk:
-            # Pass the potentially updated model and response_id to the transformer
-            openai_chunk = gemini_stream_chunk_to_openai(
-                chunk, self.model, self.response_id
+        # Pass the potentially updated model and response_id to the transformer
+        openai_chunk = gemini_stream_chunk_to_openai(
+            chunk, self.model, self.response_id, self.created
+        )
+        yield (
+            b"data: "
+            + openai_chunk.__pydantic_serializer__.to_json(
+                openai_chunk, exclude_unset=True
             )
-            yield f"data: {openai_chunk.model_dump_json(exclude_unset=True)}\n\n"
+            + b"\n\n"
+        )
 
-    def format_error_chunk(self, message: str, status_code: int = 500) -> str:
+    def format_error_chunk(self, message: str, status_code: int = 500) -> bytes:
         """Formats an error message into an OpenAI-compatible SSE data chunk."""
         # OpenAI errors typically have this structure
         error_payload = {
             "error": {"message": message, "type": "server_error", "code": None}
         }
-        return f"data: {json.dumps(error_payload)}\n\n"
+        return b"data: " + orjson.dumps(error_payload) + b"\n\n"
 
     def format_response(
         self,
@@ -140,7 +158,7 @@ class ClaudeFormatter(Formatter):
     def format_chunk(
         self,
         chunk: Optional[GeminiResponse],
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         # Before processing the chunk, check if we can capture metadata from it.
         if chunk and not self.streamer.meta_data_captured:
             if chunk.responseId:
@@ -155,13 +173,15 @@ class ClaudeFormatter(Formatter):
             if chunk.responseId:
                 self.streamer.meta_data_captured = True
 
-        yield from self.streamer.format_chunk(chunk)
+        # Hand back the streamer's generator directly rather than re-yielding it,
+        # so each event crosses a single generator frame.
+        return self.streamer.format_chunk(chunk)
 
-    def format_error_chunk(self, message: str, status_code: int = 500) -> str:
+    def format_error_chunk(self, message: str, status_code: int = 500) -> bytes:
         """Formats an error message using the Claude-specific 'error' event type."""
         # Claude uses a specific event type for errors
         error_payload = {"error": {"type": "server_error", "message": message}}
-        return f"event: error\ndata: {json.dumps(error_payload)}\n\n"
+        return b"event: error\ndata: " + orjson.dumps(error_payload) + b"\n\n"
 
     def format_response(
         self,
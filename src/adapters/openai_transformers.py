@@ -1,16 +1,23 @@
-import json
+import calendar
 import time
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
 
 from ..models.gemini import (
     BatchEmbedContentResponse,
     EmbedContentResponse,
     GeminiContent,
+    GeminiFunctionCall,
+    GeminiFunctionCallingConfig,
+    GeminiFunctionResponse,
+    GeminiInlineData,
     GeminiPart,
     GeminiRequest,
     GeminiResponse,
     GeminiSystemInstruction,
+    GeminiToolConfig,
 )
 from ..models.openai import (
     FunctionCall,
@@ -36,6 +43,22 @@ from ..utils.utils import (
 
 logger = get_logger(__name__)
 
+# OpenAI message role -> Gemini content role; anything else maps to "user".
+_ROLE_MAP = {"assistant": "model", "tool": "tool"}
+
+# OpenAI string tool_choice -> Gemini functionCallingConfig mode.
+# "required" means the model must call a tool; the closest Gemini equivalent is
+# "ANY", which forces a call from the available tools.
+_TOOL_CHOICE_MODE = {"none": "NONE", "auto": "AUTO", "required": "ANY"}
+
+_FINISH_REASON_MAP = {
+    "STOP": "stop",
+    "MAX_TOKENS": "length",
+    "SAFETY": "content_filter",
+    "RECITATION": "content_filter",
+    "TOOL_USE": "tool_calls",
+}
+
 
 def openai_embedding_request_transformer(
     req: OpenAIEmbeddingRequest,
@@ -53,20 +76,17 @@ def openai_embedding_request_transformer(
     if isinstance(req.input, list):
         logger.info(f"Handling batch embedding request for {len(req.input)} items.")
         action = "batchEmbedContents"
-        gemini_requests = []
-        for text_input in req.input:
-            # Basic validation, skipping non-string inputs in the list
-            if isinstance(text_input, str):
-                gemini_requests.append(
-                    {
-                        "model": model_name,
-                        "content": {"parts": [{"text": text_input}]},
-                    }
-                )
-            else:
-                logger.warning(
-                    f"Skipping non-string item in batch embedding input: {type(text_input)}"
-                )
+        # Basic validation, skipping non-string inputs in the list
+        gemini_requests = [
+            {"model": model_name, "content": {"parts": [{"text": text_input}]}}
+            for text_input in req.input
+            if isinstance(text_input, str)
+        ]
+        skipped = len(req.input) - len(gemini_requests)
+        if skipped:
+            logger.warning(
+                f"Skipped {skipped} non-string item(s) in batch embedding input."
+            )
         request_body = {"requests": gemini_requests}
         return action, req.model, request_body
 
@@ -88,127 +108,165 @@ def gemini_response_to_openai_embedding(
     original_request: OpenAIEmbeddingRequest,
 ) -> OpenAIEmbeddingResponse:
     """Transforms a Gemini embedding response into an OpenAI-compatible one."""
+    # The upstream response has already been validated, so the OpenAI models
+    # are populated with model_construct instead of re-validating every vector.
     embedding_data_list = []
 
     if isinstance(gemini_response, EmbedContentResponse):
         # Handle single embedding response
         embedding_data_list.append(
-            OpenAIEmbeddingData(embedding=gemini_response.embedding.values, index=0)
+            OpenAIEmbeddingData.model_construct(
+                embedding=gemini_response.embedding.values, index=0
+            )
         )
     elif isinstance(gemini_response, BatchEmbedContentResponse):
         # Handle batch embedding response
-        for i, embedding in enumerate(gemini_response.embeddings):
-            embedding_data_list.append(
-                OpenAIEmbeddingData(embedding=embedding.values, index=i)
-            )
+        embedding_data_list = [
+            OpenAIEmbeddingData.model_construct(embedding=embedding.values, index=i)
+            for i, embedding in enumerate(gemini_response.embeddings)
+        ]
 
     # Placeholder for token count, as the Gemini SDK doesn't directly provide it
     # in the embedding response. A separate countTokens call would be needed for accuracy.
-    usage = OpenAIUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+    usage = OpenAIUsage.model_construct(
+        prompt_tokens=0, completion_tokens=0, total_tokens=0
+    )
 
-    return OpenAIEmbeddingResponse(
+    return OpenAIEmbeddingResponse.model_construct(
         data=embedding_data_list,
         model=original_request.model,
         usage=usage,
     )
 
 
+def _parse_base64_data_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits a `data:<mime>[;params];base64,<data>` URL into (mime_type, data)
+    using plain string searches, or returns None if it is not such a URL.
+    """
+    if not url.startswith("data:"):
+        return None
+    sep = url.find(";base64,", 5)
+    if sep < 0 or url.find(",", 5, sep) >= 0:
+        return None
+    mime_end = url.find(";", 5, sep)
+    mime_type = url[5 : mime_end if mime_end >= 0 else sep]
+    if not mime_type:
+        return None
+    return mime_type, url[sep + 8 :]
+
+
 def _transform_message_part(
     part: Dict[str, Any], message_index: int
 ) -> Optional[GeminiPart]:
     """Transforms a single part of an OpenAI message content into a GeminiPart."""
     part_type = part.get("type")
     if part_type == "text":
-        return GeminiPart(text=part.get("text", ""))
+        return GeminiPart.model_construct(text=part.get("text", ""))
     elif part_type == "image_url":
         image_url = part.get("image_url", {}).get("url")
-        if not image_url or ";base64," not in image_url:
+        parsed = _parse_base64_data_url(image_url) if image_url else None
+        if not parsed:
             logger.warning(
                 f"Skipping invalid or non-base64 image_url part in message {message_index}: {part}"
             )
             return None
-        try:
-            header, base64_data = image_url.split(",", 1)
-            mime_type = header.split(":")[1].split(";")[0]
-            return GeminiPart(inlineData={"mimeType": mime_type, "data": base64_data})
-        except (ValueError, IndexError) as e:
-            logger.warning(
-                f"Could not parse image_url in message {message_index}: {image_url}. Error: {e}"
+        mime_type, base64_data = parsed
+        return GeminiPart.model_construct(
+            inlineData=GeminiInlineData.model_construct(
+                mimeType=mime_type, data=base64_data
             )
-            return None
+        )
     return None
 
 
-def _transform_messages(messages: List[OpenAIChatMessage]) -> List[GeminiContent]:
-    """Transforms a list of OpenAI messages to a list of GeminiContent objects."""
-    contents = []
-    for i, message in enumerate(messages):
-        role = (
-            "model"
-            if message.role == "assistant"
-            else "tool"
-            if message.role == "tool"
-            else "user"
-        )
+def _decode_tool_call_arguments(arguments: str) -> Dict[str, Any]:
+    """Parses a tool call's JSON arguments string, falling back to an empty dict."""
+    try:
+        return orjson.loads(arguments)
+    except orjson.JSONDecodeError:
+        logger.warning(f"Could not decode tool call arguments: {arguments}")
+        return {}
 
-        parts = []
-        if role == "tool":
-            parts.append(
-                GeminiPart(
-                    functionResponse={
-                        "name": message.tool_call_id,
-                        "response": {"content": message.content},
-                    }
+
+def _transform_single_message(
+    message: OpenAIChatMessage, message_index: int
+) -> Optional[GeminiContent]:
+    """Transforms one OpenAI message into a GeminiContent, or None if it has no parts."""
+    role = _ROLE_MAP.get(message.role, "user")
+
+    if role == "tool":
+        parts = [
+            GeminiPart.model_construct(
+                functionResponse=GeminiFunctionResponse.model_construct(
+                    name=message.tool_call_id,
+                    response={"content": message.content},
                 )
             )
-        elif isinstance(message.content, list):
-            for part_data in message.content:
-                transformed_part = _transform_message_part(part_data, i)
-                if transformed_part:
-                    parts.append(transformed_part)
-        elif message.content is not None:
-            parts.append(GeminiPart(text=message.content))
-
-        if message.role == "assistant" and message.tool_calls:
-            for tool_call in message.tool_calls:
-                try:
-                    args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        f"Could not decode tool call arguments: {tool_call.function.arguments}"
-                    )
-                    args = {}
-                parts.append(
-                    GeminiPart(
-                        functionCall={
-                            "name": tool_call.function.name,
-                            "args": args,
-                        }
-                    )
+        ]
+    elif isinstance(message.content, list):
+        parts = [
+            transformed_part
+            for part_data in message.content
+            if (transformed_part := _transform_message_part(part_data, message_index))
+        ]
+    elif message.content is not None:
+        parts = [GeminiPart.model_construct(text=message.content)]
+    else:
+        parts = []
+
+    if role == "model" and message.tool_calls:
+        parts.extend(
+            GeminiPart.model_construct(
+                functionCall=GeminiFunctionCall.model_construct(
+                    name=tool_call.function.name,
+                    args=_decode_tool_call_arguments(tool_call.function.arguments),
                 )
+            )
+            for tool_call in message.tool_calls
+        )
 
-        if parts:
-            contents.append(GeminiContent(role=role, parts=parts))
+    if not parts:
+        return None
+    return GeminiContent.model_construct(role=role, parts=parts)
 
-    return contents
+
+def _transform_messages(messages: List[OpenAIChatMessage]) -> List[GeminiContent]:
+    """Transforms a list of OpenAI messages to a list of GeminiContent objects."""
+    return [
+        content
+        for i, message in enumerate(messages)
+        if (content := _transform_single_message(message, i))
+    ]
 
 
 def _transform_generation_config(req: OpenAIChatCompletionRequest) -> Dict[str, Any]:
     """Builds the generationConfig dictionary from an OpenAI request."""
-    config = {
-        "temperature": req.temperature,
-        "topP": req.top_p,
-        "maxOutputTokens": req.max_tokens,
-        "stopSequences": [req.stop] if isinstance(req.stop, str) else req.stop,
-        "frequencyPenalty": req.frequency_penalty,
-        "presencePenalty": req.presence_penalty,
-        "candidateCount": req.n,
-        "seed": req.seed,
-    }
-    if req.response_format and req.response_format.get("type") == "json_object":
+    # Only fields the client actually set are emitted.
+    config = {}
+    if req.temperature is not None:
+        config["temperature"] = req.temperature
+    if req.top_p is not None:
+        config["topP"] = req.top_p
+    if req.max_tokens is not None:
+        config["maxOutputTokens"] = req.max_tokens
+    stop = req.stop
+    if stop is not None:
+        config["stopSequences"] = [stop] if isinstance(stop, str) else stop
+    if req.frequency_penalty is not None:
+        config["frequencyPenalty"] = req.frequency_penalty
+    if req.presence_penalty is not None:
+        config["presencePenalty"] = req.presence_penalty
+    if req.n is not None:
+        config["candidateCount"] = req.n
+    if req.seed is not None:
+        config["seed"] = req.seed
+
+    response_format = req.response_format
+    if response_format and response_format.get("type") == "json_object":
         config["responseMimeType"] = "application/json"
 
-    return {k: v for k, v in config.items() if v is not None}
+    return config
 
 
 def _transform_tools(
@@ -222,25 +280,19 @@ def _transform_tools(
 
 def _transform_tool_config(
     req: OpenAIChatCompletionRequest,
-) -> Optional[Dict[str, Any]]:
-    """Builds the toolConfig dictionary from an OpenAI request."""
-    if not req.tool_choice:
+) -> Optional[GeminiToolConfig]:
+    """Builds the toolConfig from an OpenAI request."""
+    tool_choice = req.tool_choice
+    if not tool_choice:
         return None
 
     mode = None
     allowed_function_names = None
 
-    if isinstance(req.tool_choice, str):
-        if req.tool_choice == "none":
-            mode = "NONE"
-        elif req.tool_choice == "auto":
-            mode = "AUTO"
-        elif req.tool_choice == "required":
-            # "required" in OpenAI means the model must call a tool.
-            # The closest Gemini equivalent is "ANY", which forces a call from the available tools.
-            mode = "ANY"
-    elif isinstance(req.tool_choice, dict):
-        function_name = req.tool_choice.get("function", {}).get("name")
+    if isinstance(tool_choice, str):
+        mode = _TOOL_CHOICE_MODE.get(tool_choice)
+    elif isinstance(tool_choice, dict):
+        function_name = tool_choice.get("function", {}).get("name")
         if function_name:
             mode = "ANY"
             allowed_function_names = [function_name]
@@ -249,36 +301,41 @@ def _transform_tool_config(
         config = {"mode": mode}
         if allowed_function_names:
             config["allowedFunctionNames"] = allowed_function_names
-        return {"functionCallingConfig": config}
+        return GeminiToolConfig.model_construct(
+            functionCallingConfig=GeminiFunctionCallingConfig.model_construct(**config)
+        )
 
     return None
 
 
 def openai_request_to_gemini(req: OpenAIChatCompletionRequest) -> GeminiRequest:
     """Converts an OpenAI Chat Completion request to a GeminiRequest Pydantic model."""
+    # The first system message becomes the system instruction and is dropped
+    # from the conversation; any later system messages are passed through.
     system_instruction = None
-    messages = list(req.messages)
-
-    system_message_index = -1
-    for i, msg in enumerate(messages):
-        if msg.role == "system":
+    system_message_seen = False
+    messages = []
+    for msg in req.messages:
+        if not system_message_seen and msg.role == "system":
+            system_message_seen = True
             if isinstance(msg.content, str):
-                system_instruction = GeminiSystemInstruction(
-                    parts=[GeminiPart(text=msg.content)]
+                system_instruction = GeminiSystemInstruction.model_construct(
+                    parts=[GeminiPart.model_construct(text=msg.content)]
                 )
-            system_message_index = i
-            break
-
-    if system_message_index != -1:
-        messages.pop(system_message_index)
+            continue
+        messages.append(msg)
 
     generation_config = _transform_generation_config(req)
 
     # Transform and then sanitize the tools
     transformed_tools = _transform_tools(req)
-    sanitized_tools = sanitize_gemini_tools(transformed_tools)
+    sanitized_tools = (
+        sanitize_gemini_tools(transformed_tools) if transformed_tools else None
+    )
 
-    gemini_request = GeminiRequest(
+    # Every field below is built internally from the already-validated request,
+    # so validation is skipped.
+    gemini_request = GeminiRequest.model_construct(
         contents=_transform_messages(messages),
         generationConfig=generation_config,
         safetySettings=DEFAULT_SAFETY_SETTINGS,
@@ -293,13 +350,12 @@ def openai_request_to_gemini(req: OpenAIChatCompletionRequest) -> GeminiRequest:
 def _gemini_candidate_to_openai_choices(
     candidate,
     is_streaming: bool = False,
-) -> Generator[
-    Union[OpenAIChatCompletionStreamChoice, OpenAIChatCompletionChoice], None, None
-]:
+) -> List[Union[OpenAIChatCompletionStreamChoice, OpenAIChatCompletionChoice]]:
     """
-    Transforms a single Gemini candidate into a generator of one or more
+    Transforms a single Gemini candidate into a list of one or more
     OpenAI choice objects, handling mixed text and tool call content.
     """
+    choices = []
     parts = candidate.content.parts
     total_parts = len(parts)
 
@@ -311,58 +367,110 @@ def _gemini_candidate_to_openai_choices(
             else None
         )
 
-        # Part 1: Yield a text choice if text exists
+        # Part 1: Add a text choice if text exists
         if part.text:
             if is_streaming:
-                delta = OpenAIDelta(content=part.text)
+                delta = OpenAIDelta.model_construct(content=part.text)
                 # Only the first part from a mixed content part should have the role
                 if not part.functionCall:
                     delta.role = "assistant"
-                yield OpenAIChatCompletionStreamChoice(
-                    index=candidate.index,
-                    delta=delta,
-                    # Finish reason is only sent with the very last yielded choice
-                    finish_reason=finish_reason if not part.functionCall else None,
+                choices.append(
+                    OpenAIChatCompletionStreamChoice.model_construct(
+                        index=candidate.index,
+                        delta=delta,
+                        # Finish reason is only sent with the very last choice
+                        finish_reason=finish_reason if not part.functionCall else None,
+                    )
                 )
             else:
-                message = OpenAIChatMessage(role="assistant", content=part.text)
-                yield OpenAIChatCompletionChoice(
-                    index=candidate.index, message=message, finish_reason=finish_reason
+                message = OpenAIChatMessage.model_construct(
+                    role="assistant", content=part.text
+                )
+                choices.append(
+                    OpenAIChatCompletionChoice.model_construct(
+                        index=candidate.index,
+                        message=message,
+                        finish_reason=finish_reason,
+                    )
                 )
 
-        # Part 2: Yield a tool call choice if a function call exists
+        # Part 2: Add a tool call choice if a function call exists
         if part.functionCall:
             fc = part.functionCall
-            tool_call = ToolCall(
+            tool_call = ToolCall.model_construct(
                 id=fc.name,
-                function=FunctionCall(name=fc.name, arguments=json.dumps(fc.args)),
+                function=FunctionCall.model_construct(
+                    name=fc.name, arguments=orjson.dumps(fc.args).decode()
+                ),
             )
 
             if is_streaming:
                 tool_call.index = 0  # Add index for streaming tool calls
-                delta = OpenAIDelta(tool_calls=[tool_call], role="assistant")
-                yield OpenAIChatCompletionStreamChoice(
-                    index=candidate.index, delta=delta, finish_reason=finish_reason
+                delta = OpenAIDelta.model_construct(
+                    tool_calls=[tool_call], role="assistant"
+                )
+                choices.append(
+                    OpenAIChatCompletionStreamChoice.model_construct(
+                        index=candidate.index, delta=delta, finish_reason=finish_reason
+                    )
                 )
             else:
                 # For non-streaming, the message content should be None when there are tool calls
-                message = OpenAIChatMessage(
+                message = OpenAIChatMessage.model_construct(
                     role="assistant", content=None, tool_calls=[tool_call]
                 )
-                yield OpenAIChatCompletionChoice(
-                    index=candidate.index, message=message, finish_reason=finish_reason
+                choices.append(
+                    OpenAIChatCompletionChoice.model_construct(
+                        index=candidate.index,
+                        message=message,
+                        finish_reason=finish_reason,
+                    )
                 )
 
+    return choices
+
+
+def _parse_create_time(create_time: str) -> int:
+    """
+    Converts Gemini's RFC 3339 createTime to a Unix timestamp. The usual
+    `YYYY-MM-DDTHH:MM:SS[.fff]Z` form is sliced directly; anything else goes
+    through datetime.fromisoformat.
+    """
+    if (
+        create_time.endswith("Z")
+        and len(create_time) >= 20
+        and create_time[10] == "T"
+        and create_time[19] in ".Z"
+    ):
+        return calendar.timegm(
+            (
+                int(create_time[0:4]),
+                int(create_time[5:7]),
+                int(create_time[8:10]),
+                int(create_time[11:13]),
+                int(create_time[14:16]),
+                int(create_time[17:19]),
+                0,
+                0,
+                0,
+            )
+        )
+    return int(datetime.fromisoformat(create_time.replace("Z", "+00:00")).timestamp())
+
 
 def gemini_response_to_openai(
     gemini_response: GeminiResponse, original_request: OpenAIChatCompletionRequest
 ) -> OpenAIChatCompletionResponse:
     """Transforms a Gemini response into an OpenAI-compatible one."""
-    choices = []
-    for c in gemini_response.candidates:
-        choices.extend(list(_gemini_candidate_to_openai_choices(c, is_streaming=False)))
-
-    usage = OpenAIUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+    choices = [
+        choice
+        for c in gemini_response.candidates
+        for choice in _gemini_candidate_to_openai_choices(c, is_streaming=False)
+    ]
+
+    usage = OpenAIUsage.model_construct(
+        prompt_tokens=0, completion_tokens=0, total_tokens=0
+    )
     if gemini_response.usageMetadata:
         usage.prompt_tokens = gemini_response.usageMetadata.promptTokenCount or 0
         usage.completion_tokens = (
@@ -380,16 +488,13 @@ def gemini_response_to_openai(
     created_timestamp = int(time.time())
     if gemini_response.createTime:
         try:
-            dt_object = datetime.fromisoformat(
-                gemini_response.createTime.replace("Z", "+00:00")
-            )
-            created_timestamp = int(dt_object.timestamp())
+            created_timestamp = _parse_create_time(gemini_response.createTime)
         except (ValueError, TypeError):
             logger.warning(
                 f"Could not parse createTime '{gemini_response.createTime}', falling back to current time."
             )
 
-    return OpenAIChatCompletionResponse(
+    return OpenAIChatCompletionResponse.model_construct(
         id=response_id,
         object="chat.completion",
         created=created_timestamp,
@@ -400,17 +505,22 @@ def gemini_response_to_openai(
 
 
 def gemini_stream_chunk_to_openai(
-    gemini_chunk: GeminiResponse, model: str, response_id: str
+    gemini_chunk: GeminiResponse, model: str, response_id: str, created: int
 ) -> OpenAIChatCompletionStreamResponse:
-    """Builds an OpenAI-compatible stream chunk from a Gemini response chunk."""
-    choices = []
-    for c in gemini_chunk.candidates:
-        choices.extend(list(_gemini_candidate_to_openai_choices(c, is_streaming=True)))
+    """
+    Builds an OpenAI-compatible stream chunk from a Gemini response chunk.
+    `created` is fixed per stream so every chunk of a response shares it.
+    """
+    choices = [
+        choice
+        for c in gemini_chunk.candidates
+        for choice in _gemini_candidate_to_openai_choices(c, is_streaming=True)
+    ]
 
-    return OpenAIChatCompletionStreamResponse(
+    return OpenAIChatCompletionStreamResponse.model_construct(
         id=response_id,
         object="chat.completion.chunk",
-        created=int(time.time()),
+        created=created,
         model=model,
         choices=choices,
     )
@@ -433,16 +543,9 @@ def _map_finish_reason(
             )
             return "stop"
 
-    reason_map = {
-        "STOP": "stop",
-        "MAX_TOKENS": "length",
-        "SAFETY": "content_filter",
-        "RECITATION": "content_filter",
-        "TOOL_USE": "tool_calls",
-    }
-
-    if gemini_reason in reason_map:
-        return reason_map[gemini_reason]
+    mapped = _FINISH_REASON_MAP.get(gemini_reason)
+    if mapped:
+        return mapped
 
     logger.warning(
         f"Received unhandled Gemini finishReason '{gemini_reason}', defaulting to 'stop'."
@@ -6,17 +6,28 @@ from ..core.credential_manager import ManagedCredential
 from ..core.exceptions import MalformedContentError, UpstreamHttpError
 from ..models.claude import ClaudeMessagesRequest
 from ..services.chat_completion_service import chat_completion_service
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, log_route_error
+from ..utils.responses import FastJSONResponse
 from ..utils.utils import generate_response_id
-from .dependencies import get_validated_credential
+from .dependencies import (
+    body_openapi_extra,
+    get_validated_credential,
+    validated_body,
+)
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
-@router.post("/v1/messages", tags=["Claude"])
+@router.post(
+    "/v1/messages",
+    tags=["Claude"],
+    openapi_extra=body_openapi_extra(ClaudeMessagesRequest),
+)
 async def claude_messages(
-    claude_request: ClaudeMessagesRequest,
+    claude_request: ClaudeMessagesRequest = Depends(
+        validated_body(ClaudeMessagesRequest)
+    ),
     managed_cred: ManagedCredential = Depends(get_validated_credential),
 ):
     """
@@ -44,10 +55,10 @@ async def claude_messages(
             source_api="Claude-compatible",
             original_request=claude_request,
         )
-    except (UpstreamHttpError, MalformedContentError):
+    except (HTTPException, UpstreamHttpError, MalformedContentError):
         raise
     except Exception as e:
-        logger.error(f"Error Processing Claude request: {e}", exc_info=True)
+        log_route_error(logger, "Error Processing Claude request", e)
         raise HTTPException(
             status_code=500, detail="An unexpected internal server error occurred."
         )
@@ -1,4 +1,8 @@
+from typing import Any, Awaitable, Callable, Dict, Type, TypeVar
+
 from fastapi import Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from ..core.credential_manager import ManagedCredential, get_rotating_credential
 from ..core.proxy_auth import authenticate_user
@@ -6,10 +10,17 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_SCHEMA_REF_TEMPLATE = "#/components/schemas/{model}"
+
+# Schemas of the bodies read through validated_body. FastAPI doesn't see these
+# models, so the app merges them into the OpenAPI components itself.
+BODY_SCHEMAS: Dict[str, Dict[str, Any]] = {}
+
 
 async def get_validated_credential(
-    request: Request,
-    username: str = Depends(authenticate_user),
+    _: bool = Depends(authenticate_user),
     managed_cred: ManagedCredential = Depends(get_rotating_credential),
 ) -> ManagedCredential:
     """
@@ -23,3 +34,67 @@ async def get_validated_credential(
             detail="No valid credentials available in the rotation pool.",
         )
     return managed_cred
+
+
+def validated_body(model: Type[ModelT]) -> Callable[..., Awaitable[ModelT]]:
+    """
+    Builds a dependency that validates the raw request body against `model`
+    in a single pydantic-core pass, instead of letting FastAPI decode the JSON
+    into a dict and validate it afterwards. Errors are reported in the same
+    shape FastAPI uses for body validation failures.
+
+    The user is authenticated first. Routes should list this dependency ahead
+    of get_validated_credential, so a malformed body is rejected before a
+    credential is taken from the pool.
+    """
+
+    async def dependency(
+        request: Request, _: bool = Depends(authenticate_user)
+    ) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+
+    return dependency
+
+
+def body_openapi_extra(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the `openapi_extra` that documents `model` as the request body of a
+    route reading it through validated_body, and registers its schema.
+    """
+    schema = model.model_json_schema(ref_template=_SCHEMA_REF_TEMPLATE)
+    BODY_SCHEMAS.update(schema.pop("$defs", {}))
+    BODY_SCHEMAS[model.__name__] = schema
+    return {
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "$ref": _SCHEMA_REF_TEMPLATE.format(model=model.__name__)
+                    }
+                }
+            },
+            "required": True,
+        },
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "$ref": _SCHEMA_REF_TEMPLATE.format(
+                                model="HTTPValidationError"
+                            )
+                        }
+                    }
+                },
+            }
+        },
+    }
@@ -1,7 +1,4 @@
-import json
-
-from fastapi import APIRouter, Depends, HTTPException, Response
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from ..adapters.formatters import FormatterContext, GeminiFormatter
 from ..core.credential_manager import ManagedCredential
@@ -17,89 +14,88 @@ from ..services.chat_completion_service import chat_completion_service
 from ..services.embedding_service import embedding_service
 from ..services.model_service import model_service
 from ..utils.constants import SUPPORTED_MODELS
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, log_route_error
+from ..utils.responses import FastJSONResponse, StaticJSONBody, model_json_response
 from ..utils.utils import generate_response_id, sanitize_gemini_tools
-from .dependencies import get_validated_credential
+from .dependencies import (
+    body_openapi_extra,
+    get_validated_credential,
+    validated_body,
+)
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
+
+_MODELS_BODY = StaticJSONBody({"models": SUPPORTED_MODELS})
+
+_gemini_request_body = validated_body(GeminiRequest)
+_gemini_request_openapi = body_openapi_extra(GeminiRequest)
 
 
 @router.get("/models")
-async def list_models(_: str = Depends(authenticate_user)):
-    models_response = {"models": SUPPORTED_MODELS}
-    return Response(
-        content=json.dumps(models_response, ensure_ascii=False),
-        status_code=200,
-        media_type="application/json; charset=utf-8",
-    )
+async def list_models(request: Request, _: str = Depends(authenticate_user)):
+    return _MODELS_BODY.response(request)
 
 
-@router.post("/models/{model_name:path}:generateContent")
-async def generate_content(
+async def _generate_content(
     model_name: str,
     gemini_request: GeminiRequest,
-    managed_cred: ManagedCredential = Depends(get_validated_credential),
+    managed_cred: ManagedCredential,
+    is_streaming: bool,
 ):
+    """Shared body of the generateContent and streamGenerateContent routes."""
     try:
         formatter_context = FormatterContext(
             response_id=generate_response_id("chatcmpl"), model=model_name
         )
         formatter = GeminiFormatter(formatter_context)
 
-        gemini_request.tools = sanitize_gemini_tools(gemini_request.tools)
+        if gemini_request.tools:
+            gemini_request.tools = sanitize_gemini_tools(gemini_request.tools)
 
         return await chat_completion_service.handle_chat_request(
             model_name=model_name,
             managed_cred=managed_cred,
             gemini_request_body=gemini_request,
-            is_streaming=False,
+            is_streaming=is_streaming,
             formatter=formatter,
             source_api="Native Gemini",
         )
-    except (UpstreamHttpError, MalformedContentError):
+    except (HTTPException, UpstreamHttpError, MalformedContentError):
         raise
     except Exception as e:
-        logger.error(
-            f"Error Processing Gemini generate content request: {e}", exc_info=True
-        )
+        action = "stream generate content" if is_streaming else "generate content"
+        log_route_error(logger, f"Error Processing Gemini {action} request", e)
         raise HTTPException(
             status_code=500, detail="An unexpected internal server error occurred."
         )
 
 
-@router.post("/models/{model_name:path}:streamGenerateContent")
-async def stream_generate_content(
+@router.post(
+    "/models/{model_name:path}:generateContent", openapi_extra=_gemini_request_openapi
+)
+async def generate_content(
     model_name: str,
-    gemini_request: GeminiRequest,
+    gemini_request: GeminiRequest = Depends(_gemini_request_body),
     managed_cred: ManagedCredential = Depends(get_validated_credential),
 ):
-    try:
-        formatter_context = FormatterContext(
-            response_id=generate_response_id("chatcmpl"), model=model_name
-        )
-        formatter = GeminiFormatter(formatter_context)
+    return await _generate_content(
+        model_name, gemini_request, managed_cred, is_streaming=False
+    )
 
-        gemini_request.tools = sanitize_gemini_tools(gemini_request.tools)
 
-        return await chat_completion_service.handle_chat_request(
-            model_name=model_name,
-            managed_cred=managed_cred,
-            gemini_request_body=gemini_request,
-            is_streaming=True,
-            formatter=formatter,
-            source_api="Native Gemini",
-        )
-    except (UpstreamHttpError, MalformedContentError):
-        raise
-    except Exception as e:
-        logger.error(
-            f"Error Processing Gemini stream generate content request: {e}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=500, detail="An unexpected internal server error occurred."
-        )
+@router.post(
+    "/models/{model_name:path}:streamGenerateContent",
+    openapi_extra=_gemini_request_openapi,
+)
+async def stream_generate_content(
+    model_name: str,
+    gemini_request: GeminiRequest = Depends(_gemini_request_body),
+    managed_cred: ManagedCredential = Depends(get_validated_credential),
+):
+    return await _generate_content(
+        model_name, gemini_request, managed_cred, is_streaming=True
+    )
 
 
 @router.post("/models/{model_name:path}:countTokens")
@@ -113,10 +109,7 @@ async def count_tokens(
     validated_response = await model_service.count_tokens(
         model_name, managed_cred, payload
     )
-    return JSONResponse(
-        content=validated_response.model_dump(exclude_unset=True),
-        status_code=200,
-    )
+    return model_json_response(validated_response, exclude_unset=True)
 
 
 @router.post("/models/{model_name:path}:embedContent")
@@ -132,10 +125,7 @@ async def embed_content(
         model_name=model_name,
         payload=payload,
     )
-    return JSONResponse(
-        content=validated_response.model_dump(exclude_unset=True),
-        status_code=200,
-    )
+    return model_json_response(validated_response, exclude_unset=True)
 
 
 @router.post("/models/{model_name:path}:batchEmbedContents")
@@ -151,7 +141,4 @@ async def batch_embed_contents(
         model_name=model_name,
         payload=payload,
     )
-    return JSONResponse(
-        content=validated_response.model_dump(exclude_unset=True),
-        status_code=200,
-    )
+    return model_json_response(validated_response, exclude_unset=True)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import ValidationError
 
 from ..adapters.adapters import openai_adapter, openai_embedding_adapter
@@ -15,12 +15,32 @@ from ..models.openai import (
 from ..services.chat_completion_service import chat_completion_service
 from ..services.embedding_service import embedding_service
 from ..utils.constants import SUPPORTED_MODELS
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, log_route_error
+from ..utils.responses import FastJSONResponse, StaticJSONBody, model_json_response
 from ..utils.utils import generate_response_id
-from .dependencies import get_validated_credential
+from .dependencies import (
+    body_openapi_extra,
+    get_validated_credential,
+    validated_body,
+)
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
+
+_OPENAI_MODELS_BODY = StaticJSONBody(
+    {
+        "object": "list",
+        "data": [
+            {
+                "id": model["name"],
+                "object": "model",
+                "created": 1677610602,  # Static timestamp
+                "owned_by": "google",
+            }
+            for model in SUPPORTED_MODELS
+        ],
+    }
+)
 
 
 @router.post("/v1/embeddings", response_model=OpenAIEmbeddingResponse)
@@ -41,21 +61,29 @@ async def openai_embeddings(
         # a compliant object for consistency.
         formatter_context = FormatterContext(response_id="", model=model_name)
         formatter = openai_embedding_adapter.formatter_class(formatter_context)
-        return formatter.format_response(validated_gemini_response, request)
+        return model_json_response(
+            formatter.format_response(validated_gemini_response, request)
+        )
 
-    except (UpstreamHttpError, MalformedContentError, ValidationError):
+    except (HTTPException, UpstreamHttpError, MalformedContentError, ValidationError):
         raise
     except Exception as e:
-        logger.error(f"Error Processing OpenAI embedding request: {e}", exc_info=True)
+        log_route_error(logger, "Error Processing OpenAI embedding request", e)
         raise HTTPException(
             status_code=500,
             detail="An unexpected internal server error occurred.",
         )
 
 
-@router.post("/v1/chat/completions", response_model=OpenAIChatCompletionResponse)
+@router.post(
+    "/v1/chat/completions",
+    response_model=OpenAIChatCompletionResponse,
+    openapi_extra=body_openapi_extra(OpenAIChatCompletionRequest),
+)
 async def openai_chat_completions(
-    request: OpenAIChatCompletionRequest,
+    request: OpenAIChatCompletionRequest = Depends(
+        validated_body(OpenAIChatCompletionRequest)
+    ),
     managed_cred: ManagedCredential = Depends(get_validated_credential),
 ):
     try:
@@ -76,12 +104,10 @@ async def openai_chat_completions(
             source_api="OpenAI-compatible",
             original_request=request,
         )
-    except (UpstreamHttpError, MalformedContentError):
+    except (HTTPException, UpstreamHttpError, MalformedContentError):
         raise
     except Exception as e:
-        logger.error(
-            f"Error Processing OpenAI chat completions request: {e}", exc_info=True
-        )
+        log_route_error(logger, "Error Processing OpenAI chat completions request", e)
         raise HTTPException(
             status_code=500,
             detail="An unexpected internal server error occurred.",
@@ -89,14 +115,5 @@ async def openai_chat_completions(
 
 
 @router.get("/v1/models")
-async def openai_list_models(_: str = Depends(authenticate_user)):
-    openai_models = [
-        {
-            "id": model["name"],
-            "object": "model",
-            "created": 1677610602,  # Static timestamp
-            "owned_by": "google",
-        }
-        for model in SUPPORTED_MODELS
-    ]
-    return {"object": "list", "data": openai_models}
+async def openai_list_models(request: Request, _: str = Depends(authenticate_user)):
+    return _OPENAI_MODELS_BODY.response(request)
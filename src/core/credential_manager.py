@@ -1,13 +1,14 @@
 import asyncio
-import json
+import datetime
 import time
 from typing import List, Optional
 
+import orjson
 from fastapi import HTTPException
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.oauth2.credentials import Credentials
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ..utils.constants import SCOPES
 from ..utils.logger import format_log, get_logger
@@ -19,6 +20,12 @@ logger = get_logger(__name__)
 INITIAL_BACKOFF_SECONDS = 60  # 1 minute
 MAX_BACKOFF_SECONDS = 600  # 10 minutes
 
+# --- Constants for Proactive Refresh ---
+# google-auth already treats a token as expired ~4 minutes before its expiry,
+# so refresh ahead of that to keep request handlers off the refresh path.
+PROACTIVE_REFRESH_SECONDS = 300  # 5 minutes
+REFRESH_CHECK_INTERVAL_SECONDS = 30
+
 
 class ManagedCredential(BaseModel):
     """Encapsulates a credential and its associated state."""
@@ -32,6 +39,12 @@ class ManagedCredential(BaseModel):
     last_failure_timestamp: Optional[float] = Field(None, exclude=True)
     current_backoff_seconds: float = Field(INITIAL_BACKOFF_SECONDS, exclude=True)
 
+    # Serializes token refreshes so concurrent tasks never send the same
+    # refresh token twice.
+    _refresh_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+    # Serializes project discovery and onboarding for the same reason.
+    _prepare_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -41,8 +54,8 @@ class CredentialManager:
 
     def __init__(self):
         self._credentials: List[ManagedCredential] = []
-        self._lock = asyncio.Lock()
         self._next_credential_index: int = 0
+        self._refresh_task: Optional[asyncio.Task] = None
         self.load_credentials()
 
     def load_credentials(self):
@@ -64,14 +77,14 @@ class CredentialManager:
             return False
 
         try:
-            creds_list = json.loads(creds_json_list_str)
+            creds_list = orjson.loads(creds_json_list_str)
             if not isinstance(creds_list, list):
                 raise ValueError("CREDENTIALS_JSON_LIST must be a JSON array.")
 
             for cred_info in creds_list:
                 self._add_credential_from_info(cred_info)
             return True
-        except (json.JSONDecodeError, ValueError) as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             logger.error(f"Failed to parse CREDENTIALS_JSON_LIST: {e}")
             return False
 
@@ -80,10 +93,9 @@ class CredentialManager:
         storage_path = settings.PERSISTENT_STORAGE_PATH
         for file_path in storage_path.glob("oauth_creds_*.json"):
             try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    cred_info = json.load(f)
-                    self._add_credential_from_info(cred_info, str(file_path))
-            except (json.JSONDecodeError, IOError) as e:
+                cred_info = orjson.loads(file_path.read_bytes())
+                self._add_credential_from_info(cred_info, str(file_path))
+            except (orjson.JSONDecodeError, IOError) as e:
                 logger.warning(
                     f"Could not load or parse credential file {file_path}: {e}"
                 )
@@ -124,7 +136,7 @@ class CredentialManager:
         )
         refresh_tasks = []
         for cred in self._credentials:
-            if cred.credential.expired and cred.credential.refresh_token:
+            if not cred.credential.valid and cred.credential.refresh_token:
                 refresh_tasks.append(self._refresh_credential(cred))
 
         if not refresh_tasks:
@@ -140,8 +152,29 @@ class CredentialManager:
             f"Credential warm-up complete. Refreshed: {success_count}, Failed: {failure_count}"
         )
 
-    async def _refresh_credential(self, managed_cred: ManagedCredential) -> bool:
-        """Refreshes a single credential and handles backoff logic."""
+    async def _refresh_credential(
+        self, managed_cred: ManagedCredential, force: bool = False
+    ) -> bool:
+        """
+        Refreshes a single credential and handles backoff logic. Concurrent
+        callers for the same credential share the outcome of one refresh.
+        A still-valid token is only replaced when `force` is set.
+        """
+        token_before = managed_cred.credential.token
+        failure_before = managed_cred.last_failure_timestamp
+        async with managed_cred._refresh_lock:
+            # Another task may have refreshed (or failed to refresh) the
+            # credential while this one was waiting for the lock.
+            if managed_cred.credential.valid and (
+                not force or managed_cred.credential.token != token_before
+            ):
+                return True
+            if managed_cred.last_failure_timestamp != failure_before:
+                return False
+            return await self._do_refresh(managed_cred)
+
+    async def _do_refresh(self, managed_cred: ManagedCredential) -> bool:
+        """Performs the refresh; callers must hold the credential's refresh lock."""
         email = managed_cred.user_email or "unknown_email"
         try:
             await asyncio.to_thread(
@@ -173,53 +206,120 @@ class CredentialManager:
             )
             return False
 
-    async def get_next_credential(self) -> Optional[ManagedCredential]:
-        """Rotates and returns the next valid and refreshed credential."""
-        if not self._credentials:
-            return None
+    def start_background_refresh(self):
+        """Starts the task that refreshes tokens shortly before they expire."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._proactive_refresh_loop())
 
-        async with self._lock:
-            # Loop through all available credentials to find a valid one
-            for _ in range(len(self._credentials)):
-                index = self._next_credential_index
-                managed_cred = self._credentials[index]
-                self._next_credential_index = (self._next_credential_index + 1) % len(
-                    self._credentials
+    async def stop_background_refresh(self):
+        """Cancels the background refresh task, if it is running."""
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    def _is_in_backoff(self, managed_cred: ManagedCredential) -> bool:
+        if not managed_cred.last_failure_timestamp:
+            return False
+        time_since_failure = time.time() - managed_cred.last_failure_timestamp
+        return time_since_failure < managed_cred.current_backoff_seconds
+
+    def _needs_proactive_refresh(
+        self, managed_cred: ManagedCredential, now: datetime.datetime
+    ) -> bool:
+        credential = managed_cred.credential
+        if not credential.refresh_token or credential.expiry is None:
+            # Never-fetched tokens are handled by warm-up and on request.
+            return False
+        if self._is_in_backoff(managed_cred):
+            return False
+        seconds_left = (credential.expiry - now).total_seconds()
+        return seconds_left < PROACTIVE_REFRESH_SECONDS
+
+    async def _proactive_refresh_loop(self):
+        """
+        Periodically refreshes tokens that are about to expire, so requests
+        rarely have to wait on a refresh round-trip.
+        """
+        while True:
+            await asyncio.sleep(REFRESH_CHECK_INTERVAL_SECONDS)
+            try:
+                # google-auth stores expiry as a naive UTC datetime.
+                now = datetime.datetime.now(datetime.timezone.utc).replace(
+                    tzinfo=None
                 )
+                due = [
+                    cred
+                    for cred in self._credentials
+                    if self._needs_proactive_refresh(cred, now)
+                ]
+                if due:
+                    logger.info(f"Proactively refreshing {len(due)} credential(s).")
+                    await asyncio.gather(
+                        *(
+                            self._refresh_credential(cred, force=True)
+                            for cred in due
+                        )
+                    )
+            except Exception as e:
+                logger.error(f"Error during proactive credential refresh: {e}")
 
-                email = managed_cred.user_email or "unknown_email"
+    def _next_in_rotation(self) -> tuple[int, ManagedCredential]:
+        """
+        Returns the next credential in round-robin order. It never awaits, so
+        the index update is atomic on the event loop and needs no lock.
+        """
+        index = self._next_credential_index
+        self._next_credential_index = (index + 1) % len(self._credentials)
+        return index, self._credentials[index]
 
-                # Check if the credential is in a backoff period
-                if managed_cred.last_failure_timestamp:
-                    time_since_failure = (
-                        time.time() - managed_cred.last_failure_timestamp
-                    )
-                    if time_since_failure < managed_cred.current_backoff_seconds:
-                        logger.info(
-                            f"Skipping credential for {email} due to active backoff."
-                        )
-                        continue  # Skip to the next credential
-
-                log_info = {
-                    "index": index,
-                    "user_email": email,
-                    "project_id": managed_cred.project_id or "unknown_project",
-                    "refresh_token_snippet": f"...{managed_cred.credential.refresh_token[-5:]}",
-                }
-                logger.info(format_log("Credential Selection", log_info, is_json=True))
-
-                # If the credential is not expired, it's good to use
-                if not managed_cred.credential.expired:
-                    return managed_cred
-
-                # If it's expired, try to refresh it
-                if managed_cred.credential.refresh_token:
-                    logger.info(f"Credential for {email} expired. Refreshing...")
-                    if await self._refresh_credential(managed_cred):
-                        logger.info(f"Credential for {email} refreshed successfully.")
-                        return managed_cred  # Return the now-refreshed credential
-                    else:
-                        continue  # Refresh failed, try the next credential
+    async def get_next_credential(self) -> Optional[ManagedCredential]:
+        """
+        Rotates and returns the next valid and refreshed credential. Only the
+        credential being refreshed is locked, so a slow refresh doesn't hold up
+        requests that can be served by other credentials.
+        """
+        if not self._credentials:
+            return None
+
+        # Loop through all available credentials to find a valid one
+        for _ in range(len(self._credentials)):
+            index, managed_cred = self._next_in_rotation()
+            email = managed_cred.user_email or "unknown_email"
+
+            # Backoff only rules out credentials that need a refresh; a failed
+            # proactive refresh leaves a still-valid token usable.
+            if (
+                self._is_in_backoff(managed_cred)
+                and not managed_cred.credential.valid
+            ):
+                logger.info(f"Skipping credential for {email} due to active backoff.")
+                continue  # Skip to the next credential
+
+            log_info = {
+                "index": index,
+                "user_email": email,
+                "project_id": managed_cred.project_id or "unknown_project",
+                "refresh_token_snippet": f"...{managed_cred.credential.refresh_token[-5:]}",
+            }
+            logger.info(format_log("Credential Selection", log_info, is_json=True))
+
+            # If the credential has a live token, it's good to use
+            if managed_cred.credential.valid:
+                return managed_cred
+
+            # If it's expired (or was never fetched), try to refresh it
+            if managed_cred.credential.refresh_token:
+                logger.info(f"Credential for {email} expired. Refreshing...")
+                if await self._refresh_credential(managed_cred):
+                    logger.info(f"Credential for {email} refreshed successfully.")
+                    return managed_cred  # Return the now-refreshed credential
+                else:
+                    continue  # Refresh failed, try the next credential
 
         logger.error(
             "No valid credentials available in the pool after checking all of them."
@@ -1,7 +1,8 @@
-import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional, Union
 
 import httpx
+import orjson
 
 from ..core.exceptions import UpstreamHttpError
 from ..utils.logger import format_log, get_logger, log_upstream_request
@@ -14,19 +15,59 @@ from .upstream_auth import AuthStrategy
 
 logger = get_logger(__name__)
 
+# A single client is shared by all upstream calls, streaming or not, so
+# keep-alive connections (and their TLS sessions) are reused across requests.
+# It is created lazily on first use and closed by the application lifespan.
+_http_client: Optional[httpx.AsyncClient] = None
 
-async def send_request(
-    target_url: str, payload: Dict[str, Any], auth_strategy: AuthStrategy
-) -> httpx.Response:
+# Long-lived streams hold their connection for the whole response, so the pool
+# is capped explicitly. When it is exhausted, new requests fail fast after
+# POOL_TIMEOUT_SECONDS instead of queueing for the full upstream timeout.
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+POOL_TIMEOUT_SECONDS = 10.0
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the shared upstream HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.UPSTREAM_TIMEOUT, pool=POOL_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            # Every upstream call sends JSON with the same User-Agent, so these
+            # are set once here and only auth headers are added per request.
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": get_user_agent(),
+            },
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Closes the shared upstream HTTP client, if it was ever created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def build_request_kwargs(
+    target_url: str,
+    payload: Union[Dict[str, Any], bytes],
+    auth_strategy: AuthStrategy,
+) -> Dict[str, Any]:
     """
-    Sends a non-streaming, authenticated request to a Google API using a specified
-    authentication strategy.
+    Encodes the payload, collects the strategy's auth headers and query params,
+    and logs the outgoing request. The result is passed straight to the shared
+    client's post() or stream() by both the non-streaming and streaming paths.
     """
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": get_user_agent(),
-        **auth_strategy.get_headers(),  # Add auth-specific headers
-    }
+    # Content-Type and User-Agent are defaults on the shared client.
+    headers = auth_strategy.get_headers()
 
     # Use the centralized logger to log the outgoing request.
     log_upstream_request(
@@ -36,42 +77,55 @@ async def send_request(
         auth_strategy_name=type(auth_strategy).__name__,
     )
 
-    async with httpx.AsyncClient(timeout=settings.UPSTREAM_TIMEOUT) as client:
-        # Allow the strategy to modify the client (e.g., add query params)
-        client = auth_strategy.prepare_client(client)
+    return {
+        "content": payload if isinstance(payload, bytes) else orjson.dumps(payload),
+        "headers": headers,
+        # Strategy-specific query params (e.g., an API key). None leaves any
+        # query string already on the URL untouched.
+        "params": auth_strategy.get_params() or None,
+    }
+
 
+async def send_request(
+    target_url: str,
+    payload: Union[Dict[str, Any], bytes],
+    auth_strategy: AuthStrategy,
+) -> httpx.Response:
+    """
+    Sends a non-streaming, authenticated request to a Google API using a specified
+    authentication strategy. The payload may be given already JSON-encoded as
+    bytes, e.g. when the same body is sent repeatedly.
+    """
+    request_kwargs = build_request_kwargs(target_url, payload, auth_strategy)
+    client = get_http_client()
+    try:
+        response = await client.post(target_url, **request_kwargs)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raw_body = e.response.content
         try:
-            final_post_data = json.dumps(payload, ensure_ascii=False)
-            response = await client.post(
-                target_url, data=final_post_data, headers=headers
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            error_body = e.response.text
-            try:
-                error_body = e.response.json()
-            except json.JSONDecodeError:
-                pass  # Keep body as text if not valid JSON
-
-            log_message = format_log(
-                f"Upstream API Error ({e.response.status_code})",
-                error_body,
-                is_json=isinstance(error_body, dict),
-            )
-            logger.warning(log_message)
-            raise UpstreamHttpError(
-                status_code=e.response.status_code, detail=error_body
-            )
-
-    if settings.DEBUG:
+            error_body = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            # Keep body as text if not valid JSON
+            error_body = raw_body.decode("utf-8", errors="replace")
+
+        log_message = format_log(
+            f"Upstream API Error ({e.response.status_code})",
+            error_body,
+            is_json=isinstance(error_body, dict),
+        )
+        logger.warning(log_message)
+        raise UpstreamHttpError(status_code=e.response.status_code, detail=error_body)
+
+    if logger.isEnabledFor(logging.DEBUG):
         log_data = {
             "status_code": response.status_code,
             "headers": dict(response.headers),
         }
         try:
-            body_json = response.json()
+            body_json = orjson.loads(response.content)
             log_data["body"] = summarize_embedding_logs(body_json)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             log_data["body"] = response.text
         logger.debug(
             format_log("Upstream Response from Google", log_data, is_json=True)
@@ -1,5 +1,7 @@
 import base64
 import binascii
+import hmac
+from functools import lru_cache
 
 from fastapi import HTTPException, Request
 
@@ -8,36 +10,54 @@ from .settings import settings
 
 logger = get_logger(__name__)
 
+_PASSWORD_BYTES = settings.GEMINI_AUTH_PASSWORD.encode("utf-8")
+
+
+def _matches_password(candidate: str) -> bool:
+    """Compares a supplied secret to the proxy password in constant time."""
+    return hmac.compare_digest(candidate.encode("utf-8"), _PASSWORD_BYTES)
+
+
+@lru_cache(maxsize=1024)
+def _check_basic_auth(credentials: str) -> bool:
+    """
+    Checks the base64 payload of a Basic auth header against the proxy password.
+    Clients resend the same header on every request, so results are cached; the
+    password comes from settings and doesn't change at runtime.
+    """
+    try:
+        decoded = base64.b64decode(credentials).decode("utf-8")
+    except (binascii.Error, ValueError):
+        # If decoding fails, it's not valid Basic auth.
+        return False
+    _, sep, password = decoded.partition(":")
+    return bool(sep) and _matches_password(password)
+
 
 def authenticate_user(request: Request) -> bool:
     """Authenticate the user based on API key/password, returning True if successful."""
+    # --- Authorization Header ---
+    # Most API clients send a Bearer token, so the header is checked first.
+    # Slicing compares the scheme prefix without a method call.
+    headers = request.headers
+    auth_header = headers.get("authorization", "")
+    if auth_header[:7] == "Bearer ":
+        if _matches_password(auth_header[7:]):
+            return True
+    elif auth_header[:6] == "Basic ":
+        if _check_basic_auth(auth_header[6:]):
+            return True
+
     # --- API Key Authentication ---
-    # Gather all possible locations for an API key.
-    potential_keys = [
-        request.query_params.get("key"),
-        request.headers.get("x-goog-api-key"),
-        request.headers.get("x-api-key"),
-    ]
-
-    auth_header = request.headers.get("authorization", "")
-    if auth_header.startswith("Bearer "):
-        potential_keys.append(auth_header[7:])
-
-    # Check if any provided key matches the password.
-    if any(key == settings.GEMINI_AUTH_PASSWORD for key in potential_keys if key):
-        return True
+    # Check the API key headers, then fall back to the `key` query parameter,
+    # which is only parsed when no header matched.
+    for key in (headers.get("x-goog-api-key"), headers.get("x-api-key")):
+        if key and _matches_password(key):
+            return True
 
-    # --- Basic Authentication ---
-    if auth_header.startswith("Basic "):
-        try:
-            decoded = base64.b64decode(auth_header[6:]).decode("utf-8")
-            _, password = decoded.split(":", 1)
-            if password == settings.GEMINI_AUTH_PASSWORD:
-                return True
-        except (binascii.Error, ValueError):
-            # If decoding fails, it's not valid Basic auth, so we pass
-            # and fall through to the final HTTPException.
-            pass
+    key = request.query_params.get("key")
+    if key and _matches_password(key):
+        return True
 
     # --- Authentication Failed ---
     raise HTTPException(
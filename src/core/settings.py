@@ -29,6 +29,10 @@ class Settings(BaseSettings):
         default=300,
         description="Timeout in seconds for requests to the upstream Google API.",
     )
+    ACCESS_LOG: bool = Field(
+        default=True,
+        description="Enable uvicorn's per-request access log. Disable in production to reduce logging overhead.",
+    )
     CORS_ALLOWED_ORIGINS: List[str] = Field(
         default=["*"],
         description='A list of origins that are allowed to make cross-origin requests. Use ["*"] for public access.',
@@ -81,6 +85,9 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
+        # Settings are read once at startup and several modules bind derived
+        # values at import time, so they must not change afterwards.
+        frozen = True
 
 
 settings = Settings()
@@ -1,85 +1,103 @@
-import json
-from typing import Any, AsyncGenerator, Dict, Union
+import logging
+from typing import Any, AsyncGenerator, Dict, Optional, Union
 
 import httpx
+import orjson
 from pydantic import ValidationError
 
 from ..adapters.formatters import Formatter, OpenAIFormatter
 from ..core.credential_manager import ManagedCredential
-from ..models.gemini import GeminiResponse
-from ..utils.logger import format_log, get_logger, log_upstream_request
-from ..utils.utils import get_user_agent
-from .settings import settings
+from ..models.gemini import GeminiResponse, GeminiUsageMetadata
+from ..utils.logger import format_log, get_logger
+from .google_api_client import build_request_kwargs, get_http_client
 from .upstream_auth import OAuthStrategy
 
 logger = get_logger(__name__)
 
 
+def _parse_sse_line(line: bytes, debug_enabled: bool) -> Optional[GeminiResponse]:
+    """
+    Parses one raw SSE line into a GeminiResponse. Returns None for blank,
+    comment and non-data lines, and for chunks that carry nothing usable.
+    """
+    line = line.strip()
+    if not line.startswith(b"data:"):
+        return None
+
+    data = line[5:].strip()
+    if not data:
+        return None
+
+    try:
+        api_response_obj = orjson.loads(data)
+        if not isinstance(api_response_obj, dict):
+            return None
+
+        # Pick the branch from the chunk's shape so the common wrapped form
+        # is validated once, without a failed validation beforehand.
+        inner = api_response_obj.get("response")
+        if inner is not None:
+            # Code Assist wraps the response and may report usage outside it.
+            gemini_response = GeminiResponse.model_validate(inner)
+            usage = api_response_obj.get("usageMetadata")
+            if usage and not gemini_response.usageMetadata:
+                gemini_response.usageMetadata = GeminiUsageMetadata.model_validate(
+                    usage
+                )
+            log_title = "Processed Chunk from Upstream"
+        elif "candidates" in api_response_obj:
+            gemini_response = GeminiResponse.model_validate(api_response_obj)
+            log_title = "Processed Chunk from Upstream"
+        elif "usageMetadata" in api_response_obj:
+            gemini_response = GeminiResponse(
+                candidates=[], usageMetadata=api_response_obj["usageMetadata"]
+            )
+            log_title = "Processed Chunk from Upstream (Metadata Only)"
+        else:
+            return None
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        logger.warning(
+            f"Skipping a malformed SSE chunk. Error: {e}. "
+            f"Chunk: '{data.decode('utf-8', errors='replace')}'"
+        )
+        return None
+
+    if debug_enabled:
+        logger.debug(
+            format_log(
+                log_title,
+                gemini_response.model_dump(exclude_unset=True),
+                is_json=True,
+            )
+        )
+    return gemini_response
+
+
 async def _parse_google_sse(
     response: httpx.Response,
 ) -> AsyncGenerator[GeminiResponse, None]:
     """
-    Parses Google's SSE stream line-by-line.
+    Parses Google's SSE stream line-by-line. Lines are split from the raw
+    bytes and handed to orjson as-is, skipping the text decode and line
+    splitting that aiter_lines() would do in Python. Each network chunk is
+    split in place; only an incomplete trailing line is carried over.
     """
+    # Resolved once per stream; honours the logger's configured level so
+    # per-chunk dumps are skipped unless a DEBUG record would be emitted.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     logger.debug("Starting to iterate over SSE stream from Google.")
-    async for line in response.aiter_lines():
-        if not line:
-            continue
-        line = line.strip()
-        if not line.startswith("data:"):
-            continue
-
-        data_str = line[len("data:") :].strip()
-        if not data_str:
-            continue
-
-        try:
-            api_response_obj = json.loads(data_str)
-            gemini_response = None
-
-            try:
-                gemini_response = GeminiResponse.model_validate(api_response_obj)
-            except ValidationError:
-                if "response" in api_response_obj:
-                    gemini_response = GeminiResponse.model_validate(
-                        api_response_obj["response"]
-                    )
-                    if (
-                        "usageMetadata" in api_response_obj
-                        and not gemini_response.usageMetadata
-                    ):
-                        gemini_response.usageMetadata = api_response_obj.get(
-                            "usageMetadata"
-                        )
-
-            if gemini_response:
-                if settings.DEBUG:
-                    logger.debug(
-                        format_log(
-                            "Processed Chunk from Upstream",
-                            gemini_response.model_dump(exclude_unset=True),
-                            is_json=True,
-                        )
-                    )
-                yield gemini_response
-            elif "usageMetadata" in api_response_obj:
-                gemini_response = GeminiResponse(
-                    candidates=[], usageMetadata=api_response_obj["usageMetadata"]
-                )
-                if settings.DEBUG:
-                    logger.debug(
-                        format_log(
-                            "Processed Chunk from Upstream (Metadata Only)",
-                            gemini_response.model_dump(exclude_unset=True),
-                            is_json=True,
-                        )
-                    )
+    tail = b""
+    async for chunk in response.aiter_bytes():
+        if tail:
+            chunk = tail + chunk
+        *lines, tail = chunk.split(b"\n")
+        for line in lines:
+            if gemini_response := _parse_sse_line(line, debug_enabled):
                 yield gemini_response
 
-        except (json.JSONDecodeError, ValidationError) as e:
-            logger.warning(
-                f"Skipping a malformed SSE chunk. Error: {e}. Chunk: '{data_str}'"
-            )
+    # The last event may not be followed by a newline.
+    if tail and (gemini_response := _parse_sse_line(tail, debug_enabled)):
+        yield gemini_response
     logger.debug("Finished iterating over SSE stream from Google.")
 
 
@@ -117,39 +135,25 @@ class StreamProcessor:
         Connects to the upstream API and yields either GeminiResponse chunks
         or a StreamError.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": get_user_agent(),
-            **self.auth_strategy.get_headers(),
-        }
-        final_post_data = json.dumps(self.payload, ensure_ascii=False)
-
-        # Log the outgoing request using the centralized utility.
-        log_upstream_request(
-            url=self.target_url,
-            headers=headers,
-            payload=self.payload,
-            auth_strategy_name=type(self.auth_strategy).__name__,
+        request_kwargs = build_request_kwargs(
+            self.target_url, self.payload, self.auth_strategy
         )
 
-        async with httpx.AsyncClient(timeout=settings.UPSTREAM_TIMEOUT) as client:
-            async with client.stream(
-                "POST",
-                self.target_url,
-                headers=headers,
-                data=final_post_data,
-            ) as response:
-                try:
-                    response.raise_for_status()
-                    async for chunk in _parse_google_sse(response):
-                        yield chunk
-                except httpx.HTTPStatusError as e:
-                    error_body = await e.response.aread()
-                    yield StreamError(
-                        status_code=e.response.status_code, message=error_body.decode()
-                    )
+        # Streams share the pooled upstream client, so keep-alive connections
+        # are reused instead of opening a new TLS connection per stream.
+        client = get_http_client()
+        async with client.stream("POST", self.target_url, **request_kwargs) as response:
+            try:
+                response.raise_for_status()
+                async for chunk in _parse_google_sse(response):
+                    yield chunk
+            except httpx.HTTPStatusError as e:
+                error_body = await e.response.aread()
+                yield StreamError(
+                    status_code=e.response.status_code, message=error_body.decode()
+                )
 
-    async def process(self) -> AsyncGenerator[str, None]:
+    async def process(self) -> AsyncGenerator[bytes, None]:
         """
         The main pipeline orchestrator. It consumes the stream generator and
         formats the output for the client, handling errors cleanly.
@@ -201,4 +205,4 @@ class StreamProcessor:
 
         # Only send [DONE] for OpenAI if there wasn't an error
         if isinstance(self.formatter, OpenAIFormatter) and not had_error:
-            yield "data: [DONE]\n\n"
+            yield b"data: [DONE]\n\n"
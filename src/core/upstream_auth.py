@@ -1,8 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict
 
-import httpx
-
 from .credential_manager import ManagedCredential
 
 
@@ -14,12 +12,13 @@ class AuthStrategy(ABC):
         """Returns the authentication headers for the request."""
         pass
 
-    def prepare_client(self, client: httpx.AsyncClient) -> httpx.AsyncClient:
+    def get_params(self) -> Dict[str, str]:
         """
-        Allows the strategy to modify the httpx.AsyncClient if needed
-        (e.g., for OAuth 2.0 flows). By default, does nothing.
+        Returns query parameters the strategy needs on the request. The HTTP
+        client is shared across requests, so strategies must not modify it.
+        By default, no parameters are added.
         """
-        return client
+        return {}
 
 
 class OAuthStrategy(AuthStrategy):
@@ -46,7 +45,6 @@ class ApiKeyStrategy(AuthStrategy):
         # API key is sent as a query param, so no extra headers are needed.
         return {}
 
-    def prepare_client(self, client: httpx.AsyncClient) -> httpx.AsyncClient:
-        """Adds the API key as a default query parameter to the client."""
-        client.params = client.params.set("key", self.api_key)
-        return client
+    def get_params(self) -> Dict[str, str]:
+        """Sends the API key as a query parameter on the request."""
+        return {"key": self.api_key}
@@ -1,21 +1,25 @@
 import asyncio
-import json
 import logging
 from contextlib import asynccontextmanager
+from typing import Any, Dict
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from .api.claude_routes import router as claude_router
+from .api.dependencies import BODY_SCHEMAS
 from .api.gemini_routes import router as gemini_router
 from .api.openai_routes import router as openai_router
 from .core.exceptions import MalformedContentError, UpstreamHttpError
 from .core.credential_manager import credential_manager
+from .core.google_api_client import close_http_client
 from .core.settings import settings
 from .utils.logger import format_log, get_logger
+from .utils.responses import FastJSONResponse
 from .utils.ui import create_page
-from .utils.utils import create_redacted_payload
+from .utils.utils import create_redacted_payload, redact_headers
 
 logger = get_logger(__name__)
 
@@ -54,6 +58,7 @@ async def lifespan(app: FastAPI):
         )
         # Asynchronously warm up credentials without blocking startup
         asyncio.create_task(credential_manager.warm_up_credentials())
+        credential_manager.start_background_refresh()
     else:
         logger.warning(
             "Proxy is running without any credentials. "
@@ -70,11 +75,14 @@ async def lifespan(app: FastAPI):
                 "Security risk: The default authentication password is being used. Please set a strong GEMINI_AUTH_PASSWORD in your environment."
             )
     yield
+    await credential_manager.stop_background_refresh()
+    await close_http_client()
 
 
 app = FastAPI(
     lifespan=lifespan,
     debug=True,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -104,7 +112,7 @@ async def request_body_logging_middleware(request: Request, call_next):
         if body:
             try:
                 # Attempt to parse and log as pretty JSON
-                json_body = json.loads(body)
+                json_body = orjson.loads(body)
                 log_body = (
                     create_redacted_payload(json_body)
                     if settings.DEBUG_REDACT_LOGS
@@ -113,7 +121,7 @@ async def request_body_logging_middleware(request: Request, call_next):
                 logger.debug(
                     format_log("Original Request Payload", log_body, is_json=True)
                 )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If not JSON, log as plain text
                 logger.debug(
                     format_log("Original Request Payload", body.decode("utf-8"))
@@ -135,7 +143,7 @@ async def debug_logging_middleware(request: Request, call_next):
         log_data = {
             "method": request.method,
             "url": str(request.url),
-            "headers": dict(request.headers),
+            "headers": redact_headers(request.headers),
         }
 
         logger.debug(format_log("Incoming Request", log_data, is_json=True))
@@ -150,7 +158,7 @@ async def malformed_content_exception_handler(
 ):
     """Handles errors where the upstream response was empty or malformed."""
     logger.error(f"MalformedContentError: {exc.message}")  # Graceful log, no traceback
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=502,  # Bad Gateway
         content={"error": {"message": exc.message, "type": "upstream_error"}},
     )
@@ -162,7 +170,7 @@ async def upstream_http_exception_handler(request: Request, exc: UpstreamHttpErr
     logger.warning(
         f"Returning HTTP {exc.status_code} to client due to upstream error: {exc.detail}"
     )
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"error": {"message": exc.detail, "type": "upstream_api_error"}},
     )
@@ -171,7 +179,7 @@ async def upstream_http_exception_handler(request: Request, exc: UpstreamHttpErr
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handles known HTTP exceptions and returns a structured error response."""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"error": {"message": exc.detail, "type": "api_error"}},
     )
@@ -184,7 +192,7 @@ async def generic_exception_handler(request: Request, exc: Exception):
         f"Unhandled exception for request {request.method} {request.url}:",
         exc_info=True,
     )
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -238,3 +246,24 @@ def health_check():
 app.include_router(openai_router)
 app.include_router(claude_router)
 app.include_router(gemini_router, prefix="/v1beta")
+
+
+def openapi() -> Dict[str, Any]:
+    """
+    Generates the OpenAPI schema, adding the request body models that routes
+    read through validated_body, which FastAPI can't discover on its own.
+    """
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        component_schemas = schema.setdefault("components", {}).setdefault(
+            "schemas", {}
+        )
+        # Encoded like FastAPI's own schemas, which drop null defaults.
+        for name, body_schema in BODY_SCHEMAS.items():
+            component_schemas.setdefault(
+                name, jsonable_encoder(body_schema, exclude_none=True)
+            )
+    return app.openapi_schema
+
+
+app.openapi = openapi
@@ -1,6 +1,8 @@
+import logging
 from typing import Any, Dict, Union
 
-from fastapi.responses import JSONResponse, StreamingResponse
+import orjson
+from fastapi.responses import StreamingResponse
 
 from ..adapters.formatters import Formatter
 from ..core.credential_manager import ManagedCredential
@@ -13,10 +15,18 @@ from ..models.gemini import GeminiRequest, GeminiResponse
 from ..services.onboarding_service import onboarding_service
 from ..utils.constants import DEFAULT_SAFETY_SETTINGS
 from ..utils.logger import format_log, get_logger
+from ..utils.responses import json_bytes_response, model_json_bytes
 from ..utils.utils import build_gemini_url, create_redacted_payload
 
 logger = get_logger(__name__)
 
+# Content-Type comes from media_type. X-Accel-Buffering stops reverse proxies
+# such as nginx from buffering the event stream.
+SSE_RESPONSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
 
 class ChatCompletionService:
     """
@@ -42,6 +52,9 @@ class ChatCompletionService:
         logger.info(
             f"Handling {source_api} Request for model '{model_name}' with action '{action}' ({streaming_status})"
         )
+        # Resolved once per request; follows the logger's configured level like
+        # the other debug dumps on the upstream path.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         request_payload = (
             gemini_request_body.model_dump(exclude_unset=True)
@@ -69,7 +82,7 @@ class ChatCompletionService:
                 )
                 request_payload["tools"].append({"googleSearch": {}})
 
-        if settings.DEBUG:
+        if debug_enabled:
             log_payload = (
                 create_redacted_payload(request_payload)
                 if settings.DEBUG_REDACT_LOGS
@@ -83,8 +96,7 @@ class ChatCompletionService:
                 )
             )
 
-        if "safetySettings" not in request_payload:
-            request_payload["safetySettings"] = DEFAULT_SAFETY_SETTINGS
+        request_payload.setdefault("safetySettings", DEFAULT_SAFETY_SETTINGS)
 
         project_id = await onboarding_service.prepare_credential(managed_cred)
         target_url = build_gemini_url(action, model_name)
@@ -101,7 +113,12 @@ class ChatCompletionService:
             )
         else:
             return await self._process_non_streaming_request(
-                managed_cred, target_url, final_payload, formatter, original_request
+                managed_cred,
+                target_url,
+                final_payload,
+                formatter,
+                original_request,
+                debug_enabled,
             )
 
     def _process_streaming_request(
@@ -112,13 +129,10 @@ class ChatCompletionService:
         formatter: Formatter,
     ):
         processor = StreamProcessor(managed_cred, target_url, payload, formatter)
-        headers = {
-            "Content-Type": "text/event-stream",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
         return StreamingResponse(
-            processor.process(), media_type="text/event-stream", headers=headers
+            processor.process(),
+            media_type="text/event-stream",
+            headers=SSE_RESPONSE_HEADERS,
         )
 
     async def _process_non_streaming_request(
@@ -128,10 +142,11 @@ class ChatCompletionService:
         payload: Dict[str, Any],
         formatter: Formatter,
         original_request: Any,
+        debug_enabled: bool,
     ):
         auth_strategy = OAuthStrategy(managed_cred)
         upstream_response = await send_request(target_url, payload, auth_strategy)
-        response_data = upstream_response.json()
+        response_data = orjson.loads(upstream_response.content)
 
         gemini_response_data = response_data.get("response") or response_data.get(
             "result"
@@ -166,17 +181,19 @@ class ChatCompletionService:
         final_response_model = formatter.format_response(
             gemini_response, original_request
         )
-        response_content = final_response_model.model_dump(exclude_unset=True)
 
-        logger.debug(
-            format_log(
-                "Sending to Client (Non-Streaming)",
-                response_content,
-                is_json=True,
+        response_body = model_json_bytes(final_response_model, exclude_unset=True)
+
+        if debug_enabled:
+            logger.debug(
+                format_log(
+                    "Sending to Client (Non-Streaming)",
+                    response_body.decode("utf-8"),
+                    is_json=True,
+                )
             )
-        )
 
-        return JSONResponse(content=response_content)
+        return json_bytes_response(response_body)
 
 
 # Create a singleton instance of the service
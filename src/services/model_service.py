@@ -1,4 +1,3 @@
-import json
 from typing import Dict
 
 from fastapi import HTTPException
@@ -42,12 +41,14 @@ class ModelService:
                 target_url, final_payload, auth_strategy
             )
 
-            validated_response = CountTokensResponse.model_validate(
-                upstream_response.json()
+            # Parse and validate the raw body in one pass; malformed JSON
+            # surfaces as a ValidationError.
+            validated_response = CountTokensResponse.model_validate_json(
+                upstream_response.content
             )
             return validated_response
 
-        except (ValidationError, json.JSONDecodeError) as e:
+        except ValidationError as e:
             logger.error(f"Error processing countTokens response: {e}", exc_info=True)
             # Re-raising as HTTPException to be caught by the global handler
             raise HTTPException(
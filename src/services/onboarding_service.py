@@ -1,7 +1,7 @@
 import asyncio
-import json
 import random
 
+import orjson
 from fastapi import HTTPException
 
 from ..core.credential_manager import ManagedCredential
@@ -20,14 +20,20 @@ class OnboardingService:
     async def prepare_credential(self, managed_cred: ManagedCredential) -> str:
         """
         Ensures the credential has a project ID and the user is onboarded.
-        Returns the project ID.
+        Returns the project ID. Concurrent callers for the same credential
+        wait for a single discovery/onboarding instead of each repeating it.
         """
-        project_id = managed_cred.project_id
-        if not project_id:
-            project_id = await self._fetch_project_id(managed_cred)
+        if managed_cred.project_id and managed_cred.is_onboarded:
+            return managed_cred.project_id
+
+        async with managed_cred._prepare_lock:
+            # Another task may have finished the work while this one waited.
+            project_id = managed_cred.project_id
+            if not project_id:
+                project_id = await self._fetch_project_id(managed_cred)
 
-        if not managed_cred.is_onboarded:
-            await self._perform_onboarding(managed_cred, project_id)
+            if not managed_cred.is_onboarded:
+                await self._perform_onboarding(managed_cred, project_id)
 
         return project_id
 
@@ -42,7 +48,7 @@ class OnboardingService:
             payload = {"metadata": get_client_metadata()}
 
             resp = await send_request(target_url, payload, auth_strategy)
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             api_project_id = data.get("cloudaicompanionProject")
             if not api_project_id:
@@ -55,7 +61,7 @@ class OnboardingService:
                 f"Discovered project ID for {managed_cred.user_email}: {api_project_id}"
             )
             return api_project_id
-        except (ValueError, json.JSONDecodeError, HTTPException) as e:
+        except (ValueError, orjson.JSONDecodeError, HTTPException) as e:
             logger.error(
                 f"Could not discover project ID from API for {managed_cred.user_email}: {e}"
             )
@@ -83,7 +89,7 @@ class OnboardingService:
             resp = await send_request(
                 f"{base_url}:loadCodeAssist", load_assist_payload, auth_strategy
             )
-            load_data = resp.json()
+            load_data = orjson.loads(resp.content)
 
             if load_data.get("currentTier"):
                 managed_cred.is_onboarded = True
@@ -107,22 +113,30 @@ class OnboardingService:
             #     {"id": "legacy-tier"},
             # )
 
-            onboard_req_payload = {
-                "tierId": tier.get("id", "standard-tier"),
-                "cloudaicompanionProject": project_id,
-                "metadata": get_client_metadata(project_id),
-            }
+            # The same request is re-sent on every poll, so encode it once.
+            onboard_req_body = orjson.dumps(
+                {
+                    "tierId": tier.get("id", "standard-tier"),
+                    "cloudaicompanionProject": project_id,
+                    "metadata": get_client_metadata(project_id),
+                }
+            )
 
             logger.info(
                 f"Onboarding user {managed_cred.user_email} for project {project_id}..."
             )
-            max_attempts = 5
-            base_delay = 1.0
+            # Poll quickly at first, since most operations finish within a
+            # second or two, then back off up to a fixed ceiling. A little
+            # jitter keeps credentials onboarded together from polling in step.
+            max_attempts = 10
+            base_delay = 0.5
+            max_delay = 5.0
+            max_jitter = base_delay * 0.5
             for attempt in range(max_attempts):
                 onboard_resp = await send_request(
-                    f"{base_url}:onboardUser", onboard_req_payload, auth_strategy
+                    f"{base_url}:onboardUser", onboard_req_body, auth_strategy
                 )
-                lro_data = onboard_resp.json()
+                lro_data = orjson.loads(onboard_resp.content)
                 if lro_data.get("done"):
                     managed_cred.is_onboarded = True
                     logger.info(
@@ -130,7 +144,9 @@ class OnboardingService:
                     )
                     return
 
-                delay = (base_delay * 2**attempt) + (random.uniform(0, 1))
+                delay = min(base_delay * 2**attempt, max_delay) + random.uniform(
+                    0, max_jitter
+                )
                 logger.info(
                     f"Onboarding not complete, retrying in {delay:.2f} seconds..."
                 )
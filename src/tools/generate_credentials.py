@@ -1,9 +1,10 @@
 import asyncio
-import json
 import os
 import re
+from pathlib import Path
 
 import httpx
+import orjson
 from fastapi import FastAPI, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from google_auth_oauthlib.flow import Flow
@@ -24,7 +25,8 @@ REDIRECT_URI = f"{settings.DOMAIN_NAME}/oauth2callback"
 os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
 
 app = FastAPI()
-auth_flow_state = {"flow": None}
+# The in-progress OAuth flow lives on the app rather than in a module global.
+app.state.auth_flow = None
 
 
 def sanitize_for_filename(text: str) -> str:
@@ -35,6 +37,16 @@ def sanitize_for_filename(text: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_.-]", "", sanitized)
 
 
+def write_credential_file(file_path: Path, creds_data: dict):
+    """
+    Writes a credential file atomically: the data goes to a temporary file
+    that then replaces the target, so a crash never leaves a half-written file.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(creds_data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, file_path)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serves the main page with the login form."""
@@ -54,7 +66,7 @@ async def root():
 
 
 @app.post("/login", response_class=RedirectResponse)
-async def login(project_id: str = Form("")):
+async def login(request: Request, project_id: str = Form("")):
     """Starts the OAuth2 flow, using a special state for discovery."""
     client_config = {
         "web": {
@@ -67,7 +79,7 @@ async def login(project_id: str = Form("")):
     flow = Flow.from_client_config(
         client_config, scopes=SCOPES, redirect_uri=REDIRECT_URI
     )
-    auth_flow_state["flow"] = flow
+    request.app.state.auth_flow = flow
 
     # If the user doesn't provide a project_id, use a special marker
     # in the state to trigger discovery in the callback.
@@ -86,7 +98,7 @@ async def login(project_id: str = Form("")):
 async def oauth2callback(request: Request):
     """Handles the OAuth2 callback, gets user info, and saves the credential file."""
     returned_state = request.query_params.get("state", "")
-    flow = auth_flow_state.get("flow")
+    flow = request.app.state.auth_flow
     if not flow:
         return create_page(
             "Error",
@@ -105,7 +117,8 @@ async def oauth2callback(request: Request):
                 headers={"Authorization": f"Bearer {creds.token}"},
             )
             userinfo_resp.raise_for_status()
-            user_email = userinfo_resp.json().get("email", "unknown_email")
+            userinfo = orjson.loads(userinfo_resp.content)
+            user_email = userinfo.get("email", "unknown_email")
 
             final_project_id = ""
             # Check if we need to discover the project ID
@@ -130,12 +143,12 @@ async def oauth2callback(request: Request):
 
                 resp = await client.post(
                     f"{settings.CODE_ASSIST_ENDPOINT}/v1internal:loadCodeAssist",
-                    data=json.dumps(discovery_payload),
+                    content=orjson.dumps(discovery_payload),
                     headers=discovery_headers,
                 )
 
                 try:
-                    response_json = resp.json()
+                    response_json = orjson.loads(resp.content)
                     logger.debug(
                         format_log(
                             f"Received project discovery response ({resp.status_code})",
@@ -148,7 +161,7 @@ async def oauth2callback(request: Request):
                         "cloudaicompanionProject", "unknown_project"
                     )
                     logger.info(f"Discovered project ID: {final_project_id}")
-                except (json.JSONDecodeError, httpx.HTTPStatusError) as e:
+                except (orjson.JSONDecodeError, httpx.HTTPStatusError) as e:
                     logger.error(
                         f"Failed to discover project ID. Response text: {resp.text}"
                     )
@@ -172,8 +185,8 @@ async def oauth2callback(request: Request):
         file_name = f"oauth_creds_{safe_email}_{safe_project}.json"
         file_path = settings.PERSISTENT_STORAGE_PATH / file_name
 
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(creds_data, f, indent=2)
+        # Keep the file I/O off the event loop.
+        await asyncio.to_thread(write_credential_file, file_path, creds_data)
 
         content = f"""
             <h1>Credential Generated!</h1>
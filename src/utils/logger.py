@@ -1,7 +1,8 @@
-import json
 import logging
 from typing import Any
 
+import httpx
+import orjson
 from rich.logging import RichHandler
 
 from ..core.settings import settings
@@ -53,15 +54,31 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def format_log(title: str, content: Any, is_json: bool = False, indent: int = 2) -> str:
+# Network-level failures reaching the upstream API (timeouts, dropped
+# connections) are expected under load and don't need a traceback.
+EXPECTED_ROUTE_ERRORS = (httpx.TransportError,)
+
+
+def log_route_error(route_logger: logging.Logger, message: str, exc: Exception):
+    """
+    Logs an error caught by a route's catch-all handler. Expected errors get a
+    single warning line; anything else is logged with its traceback.
+    """
+    if isinstance(exc, EXPECTED_ROUTE_ERRORS):
+        route_logger.warning("%s: %r", message, exc)
+    else:
+        route_logger.exception("%s: %s", message, exc)
+
+
+def format_log(title: str, content: Any, is_json: bool = False) -> str:
     """
     Formats a log message with a title and structured content.
 
     Args:
         title: The title for the log section.
         content: The content to be logged (can be a dict, str, or other object).
-        is_json: If True, tries to format the content as a JSON string.
-        indent: The indentation level for JSON content.
+        is_json: If True, tries to format the content as a JSON string,
+            indented by two spaces.
 
     Returns:
         A formatted string ready for logging.
@@ -71,9 +88,11 @@ def format_log(title: str, content: Any, is_json: bool = False, indent: int = 2)
         try:
             if isinstance(content, str):
                 # If content is already a JSON string, parse and re-dump for pretty printing
-                content = json.loads(content)
-            formatted_content = json.dumps(content, indent=indent, ensure_ascii=False)
-        except (json.JSONDecodeError, TypeError):
+                content = orjson.loads(content)
+            formatted_content = orjson.dumps(
+                content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except (orjson.JSONDecodeError, TypeError):
             # Fallback for non-JSON or non-serializable content
             pass
 
@@ -84,8 +103,11 @@ def log_upstream_request(
     url: str, headers: dict, payload: Any, auth_strategy_name: str
 ):
     """Logs a redacted, formatted upstream request if DEBUG is enabled."""
-    if settings.DEBUG:
-        from ..utils.utils import create_redacted_payload  # Lazy import
+    if logger.isEnabledFor(logging.DEBUG):
+        from ..utils.utils import create_redacted_payload, redact_headers  # Lazy import
+
+        if isinstance(payload, bytes):
+            payload = orjson.loads(payload)
 
         log_payload = (
             create_redacted_payload(payload) if settings.DEBUG_REDACT_LOGS else payload
@@ -94,7 +116,11 @@ def log_upstream_request(
         logger.debug(
             format_log(
                 log_title,
-                {"url": url, "headers": headers, "payload": log_payload},
+                {
+                    "url": url,
+                    "headers": redact_headers(headers),
+                    "payload": log_payload,
+                },
                 is_json=True,
             )
         )
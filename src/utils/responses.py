@@ -0,0 +1,71 @@
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    A JSON response rendered with orjson instead of the stdlib json module.
+    Named apart from FastAPI's deprecated ORJSONResponse, which it replaces.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_json_bytes(model: BaseModel, **dump_kwargs: Any) -> bytes:
+    """Serializes a Pydantic model straight to JSON bytes with pydantic-core."""
+    return model.__pydantic_serializer__.to_json(model, **dump_kwargs)
+
+
+def json_bytes_response(content: bytes, status_code: int = 200) -> Response:
+    """Wraps already-encoded JSON bytes in a response."""
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
+
+def model_json_response(
+    model: BaseModel, status_code: int = 200, **dump_kwargs: Any
+) -> Response:
+    """
+    Returns a Pydantic model as a JSON response, serialized straight to bytes by
+    pydantic-core without an intermediate dict or jsonable_encoder pass.
+    """
+    return json_bytes_response(model_json_bytes(model, **dump_kwargs), status_code)
+
+
+class StaticJSONBody:
+    """
+    A JSON body encoded once up front and served with a strong ETag, so clients
+    that revalidate with If-None-Match get an empty 304 instead of the body.
+    Only use it for content that never changes after import, such as the
+    static SUPPORTED_MODELS listings.
+    """
+
+    __slots__ = ("body", "etag")
+
+    media_type = "application/json; charset=utf-8"
+
+    def __init__(self, content: Any):
+        self.body = orjson.dumps(content)
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    def _matches(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        return any(
+            tag.strip().removeprefix("W/") == self.etag
+            for tag in if_none_match.split(",")
+        )
+
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type=self.media_type, headers=headers)
@@ -1,16 +1,22 @@
 import copy
+import os
 import platform
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..core.settings import settings
 from .constants import CLI_VERSION
 
 
+@lru_cache(maxsize=128)
 def build_gemini_url(action: str, model_name: str = "") -> str:
     """
     Constructs the full URL for a given Gemini API action, directing the request
-    to the appropriate endpoint based on the action.
+    to the appropriate endpoint based on the action. The endpoints come from
+    settings, which are fixed at startup, so results are cached per
+    (action, model_name).
     """
     embedding_actions = ["embedContent", "batchEmbedContents"]
 
@@ -26,13 +32,41 @@ def build_gemini_url(action: str, model_name: str = "") -> str:
         return url
 
 
+class _IdPool(threading.local):
+    """
+    Hands out version 4 UUIDs built from a buffer filled by a single
+    os.urandom call, instead of reading the OS entropy source once per ID.
+    Each thread gets its own buffer and position, so no lock is needed when
+    IDs are generated from worker threads as well as the event loop.
+    """
+
+    _BUF_SIZE = 4096
+    _ID_BYTES = 16
+
+    def __init__(self):
+        self.buf = os.urandom(self._BUF_SIZE)
+        self.pos = 0
+
+    def next_uuid(self) -> uuid.UUID:
+        pos = self.pos
+        if pos + self._ID_BYTES > self._BUF_SIZE:
+            self.buf = os.urandom(self._BUF_SIZE)
+            pos = 0
+        self.pos = pos + self._ID_BYTES
+        return uuid.UUID(bytes=self.buf[pos : pos + self._ID_BYTES], version=4)
+
+
+_id_pool = _IdPool()
+
+
 def generate_response_id(prefix: str) -> str:
     """Generates a unique response ID with a given prefix."""
     if prefix == "msg":
-        return f"msg_{uuid.uuid4().hex}"
-    return f"{prefix}-{uuid.uuid4()}"
+        return f"msg_{_id_pool.next_uuid().hex}"
+    return f"{prefix}-{_id_pool.next_uuid()}"
 
 
+@lru_cache(maxsize=None)
 def get_user_agent():
     """Generate User-Agent string matching gemini-cli format."""
     version = CLI_VERSION
@@ -43,6 +77,7 @@ def get_user_agent():
     return f"GeminiCLI/{version} ({system}; {arch})"
 
 
+@lru_cache(maxsize=None)
 def get_platform_string():
     """Generate platform string matching gemini-cli format."""
     system = platform.system().upper()
@@ -67,7 +102,8 @@ def get_platform_string():
         return "PLATFORM_UNSPECIFIED"
 
 
-def get_client_metadata(project_id=None):
+@lru_cache(maxsize=32)
+def _client_metadata(project_id=None):
     return {
         "ideType": "IDE_UNSPECIFIED",
         "platform": get_platform_string(),
@@ -76,6 +112,11 @@ def get_client_metadata(project_id=None):
     }
 
 
+def get_client_metadata(project_id=None):
+    # Built once per project; each caller gets its own copy to mutate.
+    return dict(_client_metadata(project_id))
+
+
 # def get_client_metadata(project_id=None):
 #     return {
 #         "ideType": "VSCODE",
@@ -98,6 +139,21 @@ def _redact_recursive(obj: Any):
             _redact_recursive(item)
 
 
+# Headers that carry credentials, compared in lowercase.
+SENSITIVE_HEADERS = frozenset({"authorization", "x-goog-api-key", "x-api-key"})
+
+
+def redact_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Returns a copy of the headers with credential values replaced, so tokens
+    and passwords never end up in debug logs.
+    """
+    return {
+        key: "<REDACTED>" if key.lower() in SENSITIVE_HEADERS else value
+        for key, value in headers.items()
+    }
+
+
 def create_redacted_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep copies and redacts sensitive fields from a payload for safe logging.
@@ -0,0 +1,65 @@
+import asyncio
+import datetime
+import unittest
+from unittest import mock
+
+from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+
+from src.core.credential_manager import CredentialManager, ManagedCredential
+
+
+def _managed_credential(expires_in: float) -> ManagedCredential:
+    # google-auth stores expiry as a naive UTC datetime.
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    credential = Credentials(
+        token="access-token",
+        refresh_token="refresh-token",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client-id",
+        client_secret="client-secret",
+        expiry=now + datetime.timedelta(seconds=expires_in),
+    )
+    return ManagedCredential(credential=credential, user_email="user@example.com")
+
+
+class ProactiveRefreshFailureTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        with mock.patch.object(CredentialManager, "load_credentials"):
+            self.manager = CredentialManager()
+
+    async def _fail_proactive_refresh(self, managed_cred: ManagedCredential):
+        with mock.patch.object(
+            Credentials, "refresh", side_effect=RefreshError("invalid_grant")
+        ):
+            refreshed = await self.manager._refresh_credential(
+                managed_cred, force=True
+            )
+        self.assertFalse(refreshed)
+        self.assertTrue(self.manager._is_in_backoff(managed_cred))
+
+    async def test_valid_token_is_still_handed_out(self):
+        # Inside the proactive window but not yet expired for google-auth.
+        managed_cred = _managed_credential(expires_in=270)
+        self.manager._credentials = [managed_cred]
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        self.assertTrue(self.manager._needs_proactive_refresh(managed_cred, now))
+
+        await self._fail_proactive_refresh(managed_cred)
+
+        self.assertTrue(managed_cred.credential.valid)
+        self.assertIs(await self.manager.get_next_credential(), managed_cred)
+
+    async def test_expired_token_in_backoff_is_skipped(self):
+        managed_cred = _managed_credential(expires_in=-60)
+        self.manager._credentials = [managed_cred]
+
+        await self._fail_proactive_refresh(managed_cred)
+
+        with mock.patch.object(Credentials, "refresh") as refresh:
+            self.assertIsNone(await self.manager.get_next_credential())
+        refresh.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()